@@ -0,0 +1,296 @@
+"""
+Headless batch review: score a folder or ZIP of .pdf/.txt contracts.
+
+    python batch_review.py contracts/ --out reports/ --jurisdiction India
+    python batch_review.py vendors.zip --out reports/ --workers 4 --rpm 60
+    python batch_review.py contracts/ --out /tmp/r --fake-model   # offline
+
+Writes one Markdown review per file plus report.csv / report.json.
+Progress is checkpointed to checkpoint.jsonl, so re-running the same
+command skips files that were already reviewed and retries failed ones.
+Changing the jurisdiction, doc type, model (or --fake-model) or prompt
+version reviews every file again.
+"""
+import os
+import re
+import csv
+import sys
+import json
+import time
+import zipfile
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import llm_client
+import llm_cache
+from llm_review import (
+    review_document, review_long_document, LONG_DOC_CHARS,
+    PROMPT_VERSION, CHUNK_PROMPT_VERSION, MERGE_PROMPT_VERSION,
+)
+from pdf_utils import iter_pdf_pages, pdf_page_count, join_pages, file_hash, CHARS_PER_PAGE
+from risk_scan import scan as risk_scan
+
+SUPPORTED = (".pdf", ".txt")
+CHECKPOINT = "checkpoint.jsonl"
+# A checkpointed review is only reused when all of these match the current run
+RUN_FIELDS = ("jurisdiction", "doc_type_hint", "backend", "prompt_version")
+NO_TEXT = "No extractable text (scanned PDF?)"
+REPORT_FIELDS = [
+    "file", "sha256", "status", "risk_level", "risk_score", "risk_terms",
+    "mode", "chars", "extract_s", "review_s", "total_s", "review_path", "error",
+]
+
+
+def iter_inputs(source: str):
+    """
+    Yields (name, ref) for every supported file in a directory or ZIP.
+    Nothing is read yet; read_input(source, ref) loads one file's bytes.
+    """
+    if os.path.isdir(source):
+        for root, _, files in os.walk(source):
+            for fn in sorted(files):
+                if fn.lower().endswith(SUPPORTED):
+                    path = os.path.join(root, fn)
+                    yield os.path.relpath(path, source), path
+    elif zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as zf:
+            infos = sorted(zf.infolist(), key=lambda i: i.filename)
+        for info in infos:
+            name = info.filename
+            if info.is_dir() or name.startswith("__MACOSX/") or not name.lower().endswith(SUPPORTED):
+                continue
+            yield name, info
+    else:
+        raise ValueError(f"Not a directory or ZIP file: {source}")
+
+
+def read_input(source: str, ref) -> bytes:
+    if isinstance(ref, zipfile.ZipInfo):
+        # One handle per read: worker threads read members concurrently
+        with zipfile.ZipFile(source) as zf:
+            return zf.read(ref)
+    with open(ref, "rb") as f:
+        return f.read()
+
+
+def extract_text(name: str, data: bytes) -> str:
+    if name.lower().endswith(".pdf"):
+        return join_pages(t for _, t in iter_pdf_pages(data, max_pages=None))
+    return data.decode("utf-8", errors="ignore")
+
+
+def _is_long_pdf(name: str, data: bytes) -> bool:
+    return name.lower().endswith(".pdf") and pdf_page_count(data) * CHARS_PER_PAGE > LONG_DOC_CHARS
+
+
+def _safe_name(name: str) -> str:
+    stem = os.path.splitext(name)[0]
+    return re.sub(r"[^A-Za-z0-9._-]+", "_", stem).strip("_") or "document"
+
+
+def review_file(name: str, data: bytes, jurisdiction: str, doc_type_hint: str, out_dir: str) -> dict:
+    t0 = time.perf_counter()
+    rec = {"file": name, "sha256": file_hash(data), "status": "error", "error": ""}
+    try:
+        if _is_long_pdf(name, data):
+            # Chunks are reviewed while later pages are still being extracted
+            pages = []
+
+            def _pages():
+                for _, t in iter_pdf_pages(data, max_pages=None):
+                    pages.append(t)
+                    yield t
+                rec["extract_s"] = round(time.perf_counter() - t0, 3)
+
+            t1 = time.perf_counter()
+            rec["mode"] = "chunked"
+            md = review_long_document(_pages(), jurisdiction, doc_type_hint)
+            text = join_pages(pages)
+            rec["chars"] = len(text)
+            if not text:
+                rec["error"] = NO_TEXT
+                return rec
+        else:
+            text = extract_text(name, data).strip()
+            t1 = time.perf_counter()
+            rec["extract_s"] = round(t1 - t0, 3)
+            rec["chars"] = len(text)
+            if not text:
+                rec["error"] = NO_TEXT
+                return rec
+
+            if len(text) > LONG_DOC_CHARS:
+                rec["mode"] = "chunked"
+                md = review_long_document(text, jurisdiction, doc_type_hint)
+            else:
+                rec["mode"] = "single"
+                md = review_document(text, jurisdiction, doc_type_hint)
+        rec["review_s"] = round(time.perf_counter() - t1, 3)
+
+        risk = risk_scan(text)
+        rec["risk_level"] = risk["level"]
+        rec["risk_score"] = risk["score"]
+        rec["risk_terms"] = "; ".join(risk["terms"])
+
+        if md.startswith("Error:"):
+            rec["error"] = md[6:].strip()
+            return rec
+
+        path = os.path.join(out_dir, "reviews", f"{_safe_name(name)}-{rec['sha256'][:8]}.md")
+        header = (
+            f"# Review: {name}\n\n"
+            f"**Risk (heuristic):** {risk['level']} (score {risk['score']})\n\n"
+            f"**Detected terms:** {rec['risk_terms'] or 'none'}\n\n---\n\n"
+        )
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(header + md + "\n")
+        rec["review_path"] = os.path.relpath(path, out_dir)
+        rec["status"] = "ok"
+        return rec
+    except Exception as e:
+        rec["error"] = f"{type(e).__name__}: {e}"
+        return rec
+    finally:
+        rec["total_s"] = round(time.perf_counter() - t0, 3)
+
+
+def _review_input(source: str, name: str, ref, jurisdiction: str, doc_type_hint: str, out_dir: str) -> dict:
+    # Files are read inside the worker, so only `workers` files are in memory at once
+    try:
+        data = read_input(source, ref)
+    except (OSError, zipfile.BadZipFile) as e:
+        return {"file": name, "sha256": "", "status": "error", "error": f"{type(e).__name__}: {e}"}
+    return review_file(name, data, jurisdiction, doc_type_hint, out_dir)
+
+
+def run_settings(jurisdiction: str, doc_type_hint: str) -> dict:
+    """What a review depends on besides the file itself (see RUN_FIELDS)."""
+    return {
+        "jurisdiction": jurisdiction,
+        "doc_type_hint": doc_type_hint,
+        "backend": llm_client.backend_name(),
+        "prompt_version": "|".join((PROMPT_VERSION, CHUNK_PROMPT_VERSION, MERGE_PROMPT_VERSION)),
+    }
+
+
+def _checkpoint_key(sha256: str, settings: dict) -> tuple:
+    return (sha256,) + tuple(settings.get(f) for f in RUN_FIELDS)
+
+
+def load_checkpoint(out_dir: str) -> dict:
+    """(sha256, *RUN_FIELDS) -> latest record for that file content and run settings."""
+    done = {}
+    path = os.path.join(out_dir, CHECKPOINT)
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    rec = json.loads(line)
+                except json.JSONDecodeError:
+                    # A half-written last line from an interrupted run
+                    continue
+                done[_checkpoint_key(rec["sha256"], rec)] = rec
+    return done
+
+
+def write_reports(out_dir: str, records):
+    records = sorted(records, key=lambda r: r["file"])
+    with open(os.path.join(out_dir, "report.json"), "w", encoding="utf-8") as f:
+        json.dump(records, f, indent=2, ensure_ascii=False)
+    with open(os.path.join(out_dir, "report.csv"), "w", encoding="utf-8", newline="") as f:
+        w = csv.DictWriter(f, fieldnames=REPORT_FIELDS, extrasaction="ignore")
+        w.writeheader()
+        for rec in records:
+            w.writerow(rec)
+
+
+def run_batch(source: str, out_dir: str, jurisdiction: str = "India", doc_type_hint: str = "",
+              workers: int = 4, rpm: float = None, resume: bool = True, on_progress=None) -> list:
+    """
+    Review every .pdf/.txt in source (directory or ZIP) and write the reports.
+    Returns the list of per-file records (also written to report.json/.csv).
+    on_progress(record, done, total) is called after each file.
+    """
+    os.makedirs(os.path.join(out_dir, "reviews"), exist_ok=True)
+
+    settings = run_settings(jurisdiction, doc_type_hint)
+    previous = load_checkpoint(out_dir) if resume else {}
+    records, todo = {}, []
+    for name, ref in iter_inputs(source):
+        prev = previous.get(_checkpoint_key(file_hash(read_input(source, ref)), settings)) if previous else None
+        if prev and prev.get("status") == "ok":
+            records[name] = dict(prev, file=name)
+        else:
+            todo.append((name, ref))
+
+    # The limit is process-wide; put back whatever the caller had afterwards
+    prev_rpm = llm_client.MAX_RPM
+    if rpm:
+        llm_client.set_rate_limit(rpm)
+    ckpt_lock = threading.Lock()
+    ckpt_mode = "a" if resume else "w"
+    try:
+        with open(os.path.join(out_dir, CHECKPOINT), ckpt_mode, encoding="utf-8") as ckpt, \
+                ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            futures = [
+                pool.submit(_review_input, source, name, ref, jurisdiction, doc_type_hint, out_dir)
+                for name, ref in todo
+            ]
+            for i, fut in enumerate(as_completed(futures), 1):
+                rec = dict(fut.result(), **settings)
+                records[rec["file"]] = rec
+                with ckpt_lock:
+                    ckpt.write(json.dumps(rec, ensure_ascii=False) + "\n")
+                    ckpt.flush()
+                if on_progress:
+                    on_progress(rec, i, len(todo))
+    finally:
+        if rpm:
+            llm_client.set_rate_limit(prev_rpm)
+
+    out = list(records.values())
+    write_reports(out_dir, out)
+    return out
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Batch-review a folder or ZIP of .pdf/.txt contracts.")
+    ap.add_argument("source", help="Directory or .zip containing .pdf/.txt files")
+    ap.add_argument("--out", default="batch_reports", help="Output directory (default: batch_reports)")
+    ap.add_argument("--jurisdiction", default="India")
+    ap.add_argument("--doc-type", default="", help="Optional document type hint, e.g. NDA")
+    ap.add_argument("--workers", type=int, default=4, help="Files reviewed in parallel (default: 4)")
+    ap.add_argument("--rpm", type=float, default=None, help="Max model requests per minute")
+    ap.add_argument("--no-resume", action="store_true", help="Ignore the existing checkpoint")
+    ap.add_argument("--fake-model", action="store_true", help="Use an offline stub instead of Gemini")
+    args = ap.parse_args(argv)
+
+    if args.fake_model:
+        llm_client.set_backend(llm_client.echo_backend)
+        # Keep stub output out of the shared response cache
+        llm_cache.ENABLED = False
+    elif not llm_client.has_api_key():
+        print(f"Error: {llm_client.MISSING_KEY_MSG}", file=sys.stderr)
+        return 2
+
+    def progress(rec, done, total):
+        info = f"{rec.get('risk_level', '-')} ({rec.get('risk_score', '-')})" if rec["status"] == "ok" else rec["error"]
+        print(f"[{done}/{total}] {rec['status']:5} {rec['file']}: {info}")
+
+    try:
+        records = run_batch(
+            args.source, args.out, args.jurisdiction, args.doc_type,
+            workers=args.workers, rpm=args.rpm, resume=not args.no_resume, on_progress=progress,
+        )
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    failed = [r for r in records if r["status"] != "ok"]
+    print(f"Reviewed {len(records) - len(failed)}/{len(records)} files. Reports in {args.out}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
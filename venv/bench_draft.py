@@ -0,0 +1,56 @@
+"""
+Render-throughput benchmark for the draft template layer and bulk export.
+
+    python bench_draft.py           # 500 offer letters
+    python bench_draft.py 2000      # custom row count
+"""
+import sys
+import time
+import random
+from draft_templates import render_document, _render_section
+from draft_export import bulk_export
+
+DOC_TYPE = "Employment Offer Letter"
+
+
+def make_rows(n: int, seed: int = 3):
+    rnd = random.Random(seed)
+    roles = ["Software Engineer", "Data Analyst", "Product Manager", "Designer"]
+    return [
+        {
+            "doc_type": DOC_TYPE,
+            "company": "Acme Pvt Ltd",
+            "candidate": f"Candidate {i}",
+            "role": rnd.choice(roles),
+            "salary": f"₹{rnd.randint(6, 40)} LPA",
+            "location": rnd.choice(["Mumbai", "Remote", "Bengaluru"]),
+            "opt_bg_check": True,
+            "opt_ol_conf": True,
+            "opt_ol_ip": rnd.random() < 0.5,
+        }
+        for i in range(n)
+    ]
+
+
+def timed(label: str, fn, n: int):
+    t0 = time.perf_counter()
+    fn()
+    dt = time.perf_counter() - t0
+    print(f"{label:<34} {dt * 1000:>9.1f} ms  {n / dt:>9.0f} docs/s")
+
+
+def main(n: int):
+    rows = make_rows(n)
+
+    _render_section.cache_clear()
+    timed("render (cold section cache)", lambda: [render_document(DOC_TYPE, r, "India") for r in rows], n)
+    timed("render (warm section cache)", lambda: [render_document(DOC_TYPE, r, "India") for r in rows], n)
+    print(f"  section cache: {_render_section.cache_info()}")
+
+    timed("bulk export ZIP (md)", lambda: bulk_export(DOC_TYPE, rows, "India", formats=("md",)), n)
+    timed("bulk export ZIP (md+docx)", lambda: bulk_export(DOC_TYPE, rows, "India", formats=("md", "docx")), n)
+    timed("bulk export ZIP (md+docx+pdf)", lambda: bulk_export(DOC_TYPE, rows, "India"), n)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
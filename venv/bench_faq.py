@@ -0,0 +1,155 @@
+"""
+FAQ benchmark: model calls and latency with vs. without the local FAQ index.
+
+    python bench_faq.py             # simulated model latency 0.5 s
+    python bench_faq.py 1.5         # custom latency (seconds)
+
+Runs offline against a fake model and a throwaway cache file. The workload
+mixes FAQ_BANK questions, rephrasings of them, repeats and new questions.
+The near-duplicate regression pairs below are checked first; the script
+exits with status 1 if any of them is misjudged.
+"""
+import os
+import sys
+import time
+import random
+import tempfile
+
+import llm_client
+import llm_cache
+import llm_faq
+import faq_index
+
+JURISDICTION = "India"
+
+# Rewordings a user might type instead of clicking the bank question
+PARAPHRASES = [
+    "what makes a contract valid",
+    "what should i check before i sign an nda",
+    "what does termination for convenience mean",
+    "limitation of liability meaning",
+    "what should an offer letter include",
+    "someone not paying invoice what do i do",
+    "what evidence should i keep for payment disputes",
+    "what is personal data, why does it matter in an agreement",
+]
+
+NEW_QUESTIONS = [
+    "Can my employer change my salary without notice?",
+    "Is a verbal agreement binding?",
+    "What is a force majeure clause?",
+    "Can a landlord keep my security deposit?",
+    "How long should a notice period be?",
+    "What is an indemnity clause?",
+]
+
+
+# (asked, stored, may reuse stored answer?)
+DUPLICATE_CHECKS = [
+    ("What makes a will legally valid?", "What makes a contract legally valid?", False),
+    ("What should an offer letter not include?", "What should an offer letter include?", False),
+    ("How do I reply to a notice/demand letter without escalating too hard?",
+     "How do I write a notice/demand letter without escalating too hard?", False),
+    ("Is an NDA enforceable in India?", "Is an NDA enforceable in the US?", False),
+    # Broader question than the stored one
+    ("Can my employer fire me?", "Can my employer fire me during probation?", False),
+    ("How do I terminate a lease?", "How do I terminate a lease early?", False),
+    ("Is a verbal agreement binding?", "Is a verbal agreement binding in court?", False),
+    ("What makes a contract legally valid", "What makes a contract legally valid?", True),
+    ("What should I check before I sign an NDA", "What should I check before signing an NDA?", True),
+    ("limitation of liability meaning", "What does limitation of liability mean?", True),
+    ("what does termination for convenience mean", "What does 'termination for convenience' mean?", True),
+]
+
+
+def check_duplicates() -> int:
+    """Index each stored question alone and check whether the asked one reuses it."""
+    failures = 0
+    saved, llm_cache.ENABLED = llm_cache.ENABLED, False
+    try:
+        for asked, stored, expected in DUPLICATE_CHECKS:
+            index = faq_index.FaqIndex("check", llm_faq.FAQ_BANK)
+            index.add(stored, JURISDICTION, "stored answer")
+            got = any(d["question"] == stored and d["answer"] for d in index.duplicates(asked, JURISDICTION))
+            if got != expected:
+                failures += 1
+                print(f"FAIL duplicate={got} (expected {expected}): {asked!r} vs {stored!r}")
+    finally:
+        llm_cache.ENABLED = saved
+    print(f"duplicate checks: {len(DUPLICATE_CHECKS) - failures}/{len(DUPLICATE_CHECKS)} ok")
+    return failures
+
+
+def make_workload(n: int, seed: int = 5):
+    rnd = random.Random(seed)
+    bank = [q for qs in llm_faq.FAQ_BANK.values() for q in qs]
+    pools = [bank, PARAPHRASES, NEW_QUESTIONS]
+    return [rnd.choice(rnd.choices(pools, weights=[5, 3, 2])[0]) for _ in range(n)]
+
+
+def slow_backend(delay: float):
+    def backend(model, contents, config):
+        time.sleep(delay)
+        return llm_client.echo_backend(model, contents, config)
+    return backend
+
+
+def run(workload, answer) -> dict:
+    calls0 = llm_client.stats.snapshot()["calls"]
+    lat = []
+    for q in workload:
+        t0 = time.perf_counter()
+        answer(q, JURISDICTION)
+        lat.append(time.perf_counter() - t0)
+    lat.sort()
+    return {
+        "calls": llm_client.stats.snapshot()["calls"] - calls0,
+        "p50": lat[len(lat) // 2],
+        "p95": lat[int(len(lat) * 0.95)],
+        "total": sum(lat),
+    }
+
+
+def exact_cache_only(question: str, jurisdiction: str) -> str:
+    # Previous behaviour: response cache keyed on the normalized question
+    return llm_cache.cached(
+        llm_faq._key(question, jurisdiction),
+        lambda: llm_client.safe_generate_text(
+            llm_faq._build_prompt(question, jurisdiction), temperature=llm_faq.TEMPERATURE
+        ),
+    )
+
+
+def main(delay: float) -> int:
+    if check_duplicates():
+        return 1
+
+    llm_client.set_backend(slow_backend(delay))
+    workload = make_workload(200)
+    print(f"{len(workload)} questions, simulated model latency {delay:.2f} s")
+    print(f"{'mode':<22} {'model calls':>11} {'p50 ms':>9} {'p95 ms':>9} {'total s':>8}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, answer in (("exact cache only", exact_cache_only), ("faq index", llm_faq.answer_faq)):
+            llm_cache.CACHE_PATH = os.path.join(tmp, f"{label.replace(' ', '_')}.sqlite3")
+            llm_faq._index = None
+            r = run(workload, answer)
+            print(
+                f"{label:<22} {r['calls']:>11} {r['p50'] * 1000:>9.2f} "
+                f"{r['p95'] * 1000:>9.2f} {r['total']:>8.2f}"
+            )
+
+        t0 = time.perf_counter()
+        llm_faq._index = None
+        index = llm_faq.faq_index()
+        print(f"\nindex load ({len(index)} questions): {(time.perf_counter() - t0) * 1000:.2f} ms")
+
+        t0 = time.perf_counter()
+        for q in workload:
+            llm_faq.search_faq(q, JURISDICTION, limit=8)
+        print(f"search: {(time.perf_counter() - t0) / len(workload) * 1000:.3f} ms/query")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(float(sys.argv[1]) if len(sys.argv) > 1 else 0.5))
@@ -0,0 +1,111 @@
+from llm_client import safe_generate_text, MODEL
+import llm_cache
+
+# Most recent turns (user + assistant pairs) that are always sent verbatim
+KEEP_TURNS = 4
+# Rough token budget for the verbatim part; older turns beyond it are summarized
+RECENT_TOKEN_BUDGET = 3000
+# Roll turns into the summary in batches, so we do not pay a summary call every turn
+SUMMARY_BATCH_MESSAGES = 4
+SUMMARY_MAX_WORDS = 200
+
+SUMMARY_PROMPT_VERSION = "chat-summary-v1"
+
+
+def estimate_tokens(text: str) -> int:
+    # ~4 characters per token is close enough for budgeting
+    return len(text or "") // 4 + 1
+
+
+def _tokens(messages) -> int:
+    return sum(estimate_tokens(m["content"]) for m in messages)
+
+
+def _transcript(messages) -> str:
+    return "\n\n".join(f"{m['role'].upper()}: {m['content']}" for m in messages)
+
+
+def _summarize(previous: str, messages) -> str:
+    prompt = f"""
+You maintain a running summary of a conversation between a user and LegalEase (an AI legal information assistant).
+
+Update the summary with the new messages below.
+Constraints:
+- Max {SUMMARY_MAX_WORDS} words, plain bullet points.
+- Keep facts the user shared (parties, dates, amounts, document types, jurisdiction details),
+  questions already answered (one line each) and any open questions.
+- Do NOT add advice or facts that are not in the messages.
+
+CURRENT SUMMARY (may be empty):
+{previous or "(none)"}
+
+NEW MESSAGES:
+{_transcript(messages)}
+
+Return ONLY the updated summary.
+""".strip()
+
+    key = llm_cache.cache_key(SUMMARY_PROMPT_VERSION, MODEL, 0.0, "", previous, _transcript(messages))
+    return llm_cache.cached(key, lambda: safe_generate_text(prompt, temperature=0.0))
+
+
+def _split(messages) -> int:
+    # Start of the verbatim window: last KEEP_TURNS turns, cut further to fit
+    # RECENT_TOKEN_BUDGET, always starting with a user turn
+    split = max(0, len(messages) - KEEP_TURNS * 2)
+    while split < len(messages) and _tokens(messages[split:]) > RECENT_TOKEN_BUDGET:
+        split += 1
+    while split < len(messages) and messages[split]["role"] != "user":
+        split += 1
+    return split
+
+
+def prepare_history(messages, memory: dict):
+    """
+    Split prior chat messages into (summary, recent_messages) for the next
+    request. Never calls the model; see update_memory().
+
+    messages: earlier [{"role": "user"|"assistant", "content": str}], oldest first.
+    memory:   dict kept by the caller across turns (e.g. in st.session_state);
+              holds the running summary and how many messages it covers.
+
+    Messages after the summary are sent verbatim. If that exceeds
+    RECENT_TOKEN_BUDGET (the summary is lagging, e.g. its last update failed),
+    the oldest of them are left out rather than going over budget.
+    """
+    # Summary no longer matches the history (e.g. chat was cleared)
+    if memory.get("upto", 0) > len(messages):
+        memory.clear()
+
+    upto = memory.get("upto", 0)
+    recent = messages[upto:]
+    if _tokens(recent) > RECENT_TOKEN_BUDGET:
+        recent = messages[max(upto, _split(messages)):]
+    return memory.get("summary", ""), recent
+
+
+def update_memory(messages, memory: dict):
+    """
+    Fold messages that left the verbatim window into the running summary.
+    Call after the answer has been delivered, so the summary call is not on
+    the path to the first token of the next answer.
+    """
+    if memory.get("upto", 0) > len(messages):
+        memory.clear()
+
+    upto = memory.get("upto", 0)
+    split = _split(messages)
+    pending = messages[upto:split]
+    if pending and (len(pending) >= SUMMARY_BATCH_MESSAGES or _tokens(messages[upto:]) > RECENT_TOKEN_BUDGET):
+        summary = _summarize(memory.get("summary", ""), pending)
+        if not summary.startswith("Error:"):
+            memory["summary"] = summary
+            memory["upto"] = split
+
+
+def to_contents(messages):
+    """Chat messages -> Gemini structured contents."""
+    return [
+        {"role": "model" if m["role"] == "assistant" else "user", "parts": [{"text": m["content"]}]}
+        for m in messages
+    ]
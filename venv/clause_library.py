@@ -0,0 +1,111 @@
+from functools import lru_cache
+from jinja2 import Environment, StrictUndefined
+
+# Reusable clause texts (Jinja templates), keyed by "<document>.<clause>".
+# Templates in draft_templates.py pull optional / variant clauses from here.
+CLAUSES = {
+    # ---------------- NDA ----------------
+    "nda.compelled_disclosure": """
+## Additional Clause: Compelled Disclosure
+If the Receiving Party is required by law, regulation, or court order to disclose any Confidential Information, it may do so **only to the extent required**, provided that (to the extent legally permitted) it gives the Disclosing Party prompt written notice and reasonably cooperates (at the Disclosing Party’s expense) in seeking protective treatment.
+""",
+    "nda.non_solicit": """
+## Additional Clause: Non-Solicitation
+For the term of this Agreement and for **12 months** thereafter, the Receiving Party shall not knowingly solicit for employment or engagement the Disclosing Party’s employees or contractors that it became aware of through the Purpose, except through general advertisements not targeted at such persons.
+""",
+    "nda.non_compete": """
+## Additional Clause: Limited Non-Compete (Optional)
+**Note:** Enforceability of non-compete obligations varies significantly by jurisdiction. Consider legal review.
+For the term of this Agreement and for **6 months** thereafter, the Receiving Party agrees not to use Confidential Information to build a directly competing product/service substantially similar to what was disclosed for the Purpose.
+""",
+    "nda.no_publicity": """
+## Additional Clause: No Publicity
+Neither Party shall issue public statements or use the other Party’s name, logo, or trademarks in any publicity or marketing materials regarding the Purpose without prior written consent.
+""",
+    "nda.no_assignment": """
+## Additional Clause: No Assignment
+Neither Party may assign or transfer this Agreement without the prior written consent of the other Party, except to a successor in connection with a merger, acquisition, or sale of substantially all assets, provided the successor is bound by this Agreement.
+""",
+
+    # ---------------- Service Agreement ----------------
+    "sa.ip.client_owns": """
+## 6. Intellectual Property
+Upon full payment, Contractor assigns to Client all right, title, and interest in the deliverables created specifically for Client under this Agreement, excluding Contractor’s pre-existing materials and general know-how.
+""",
+    "sa.ip.contractor_owns": """
+## 6. Intellectual Property
+Contractor retains ownership of the work product and grants Client a perpetual, non-exclusive, worldwide license to use the deliverables for Client’s internal business purposes, subject to full payment.
+""",
+    "sa.ip.exhibit": """
+## 6. Intellectual Property
+Ownership of deliverables will be as specified in Exhibit A or a written statement of work signed by both Parties.
+""",
+    "sa.confidentiality": """
+## 7. Confidentiality
+Each Party may receive confidential information from the other. The Receiving Party agrees to protect such information using reasonable care and to use it only for purposes of this Agreement. This obligation survives termination for **2 years**.
+""",
+    "sa.termination": """
+## 9. Termination
+Either Party may terminate this Agreement for convenience with **{{ notice_days }}** days’ written notice. Upon termination, Client shall pay for services performed and approved expenses incurred up to the effective termination date.
+""",
+    "sa.limitation_of_liability": """
+## 10. Limitation of Liability
+To the maximum extent permitted by law, neither Party shall be liable for indirect, incidental, special, or consequential damages. Each Party’s total liability under this Agreement shall not exceed **{{ liability_cap }}**.
+""",
+    "sa.non_solicit": """
+## 11. Non-Solicitation (Optional)
+For the term of this Agreement and for **12 months** thereafter, neither Party shall knowingly solicit for employment the other Party’s personnel who were materially involved in the Services, except through general advertisements not targeted at such personnel.
+""",
+
+    # ---------------- Offer Letter ----------------
+    "ol.at_will": """
+## Employment Relationship (At-Will)
+If applicable in your jurisdiction, your employment will be “at-will,” meaning either you or the Company may end the employment relationship at any time, with or without cause, subject to applicable law.
+""",
+    "ol.background_check": """
+## Background / Verification
+This offer is contingent upon successful completion of reference checks and any background or verification processes permitted by law.
+""",
+    "ol.confidentiality": """
+## Confidentiality
+You agree to protect the Company’s confidential information and comply with all confidentiality policies and agreements you may sign as a condition of employment.
+""",
+    "ol.ip": """
+## Intellectual Property
+You agree that intellectual property created within the scope of your employment or using Company resources belongs to the Company, subject to applicable law and any separate invention assignment agreement.
+""",
+    "ol.restrictive_covenants": """
+## Restrictive Covenants (Optional)
+Certain jurisdictions restrict non-compete obligations. If applicable, any restrictive covenants (non-compete/non-solicit) will be governed by a separate agreement and applicable law.
+""",
+
+    # ---------------- Demand / Notice Letter ----------------
+    "notice.without_prejudice": (
+        "**Without Prejudice:** This communication is made without prejudice to the Sender’s rights and remedies."
+    ),
+    "notice.payment_plan": (
+        "- If you are unable to pay the full amount immediately, propose a written payment plan within the deadline.\n"
+    ),
+    "notice.preserve_evidence": (
+        "- Preserve all records relevant to this matter (emails, messages, logs, contracts, invoices). Deletion may have legal consequences.\n"
+    ),
+    "notice.amount": "**Amount involved (if applicable):** {{ amount }}\n",
+}
+
+_env = Environment(autoescape=False, keep_trailing_newline=True, undefined=StrictUndefined)
+
+# Compiled once at import; multi-line clauses are stored without surrounding blank lines
+_COMPILED = {
+    cid: _env.from_string(src.strip() if src.startswith("\n") else src)
+    for cid, src in CLAUSES.items()
+}
+
+
+@lru_cache(maxsize=1024)
+def _render(clause_id: str, params: tuple) -> str:
+    return _COMPILED[clause_id].render(dict(params))
+
+
+def render_clause(clause_id: str, **params) -> str:
+    """Render a library clause; results are memoized per (clause, params)."""
+    return _render(clause_id, tuple(sorted(params.items())))
@@ -0,0 +1,220 @@
+import io
+import re
+import csv
+import zipfile
+import fitz  # PyMuPDF
+from docx import Document
+from markdown_it import MarkdownIt
+from draft_templates import render_document, FIELDS, CHOICE_FIELDS
+from proc_pool import MAX_WORKERS, process_pool, iter_with_fallback
+
+FORMATS = ("md", "docx", "pdf")
+# DOCX/PDF conversion is CPU-bound Python, so bulk export uses processes.
+# Small or Markdown-only batches are not worth the worker start-up.
+PARALLEL_MIN_ROWS = 20
+ROWS_PER_TASK = 8
+
+# html=False: user-typed "<...>" in form fields must not become markup
+_md = MarkdownIt("commonmark", {"html": False})
+_BOLD_RE = re.compile(r"(\*\*[^*]+\*\*|\*[^*]+\*)")
+
+PDF_CSS = """
+body { font-family: sans-serif; font-size: 10.5pt; line-height: 1.4; }
+h1 { font-size: 16pt; }
+h2 { font-size: 12.5pt; margin-top: 10pt; }
+h3 { font-size: 11pt; }
+"""
+
+
+# ---------------- Single document ----------------
+
+def _add_runs(paragraph, text: str):
+    # **bold** and *italic* are the only inline styles our templates use
+    for part in _BOLD_RE.split(text):
+        if not part:
+            continue
+        if part.startswith("**") and part.endswith("**"):
+            paragraph.add_run(part[2:-2]).bold = True
+        elif part.startswith("*") and part.endswith("*") and len(part) > 1:
+            paragraph.add_run(part[1:-1]).italic = True
+        else:
+            paragraph.add_run(part)
+
+
+def _paragraph(doc, style_id: str = None):
+    # Setting pStyle by id directly: python-docx's style setter rescans the
+    # whole styles part on every call, which dominated bulk-export time.
+    p = doc.add_paragraph()
+    if style_id:
+        p._p.style = style_id
+    return p
+
+
+def to_docx(md: str) -> bytes:
+    """Markdown draft -> .docx bytes (headings, bullets, bold/italic, rules)."""
+    doc = Document()
+    styles = doc.styles
+    heading_ids = {lvl: styles[f"Heading {lvl}"].style_id for lvl in range(1, 5)}
+    bullet_id = styles["List Bullet"].style_id
+
+    para = None
+    for line in md.splitlines():
+        stripped = line.strip()
+        if not stripped:
+            para = None
+            continue
+        m = re.match(r"^(#{1,6})\s+(.*)$", stripped)
+        if m:
+            _paragraph(doc, heading_ids[min(len(m.group(1)), 4)]).add_run(m.group(2).replace("**", ""))
+            para = None
+        elif stripped == "---":
+            _paragraph(doc).add_run("_" * 40)
+            para = None
+        elif stripped.startswith("- "):
+            _add_runs(_paragraph(doc, bullet_id), stripped[2:])
+            para = None
+        elif para is not None:
+            # Markdown soft/hard line break inside one paragraph
+            para.add_run().add_break()
+            _add_runs(para, stripped)
+        else:
+            para = _paragraph(doc)
+            _add_runs(para, stripped)
+
+    buf = io.BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+
+def to_pdf(md: str) -> bytes:
+    """Markdown draft -> A4 PDF bytes, laid out with PyMuPDF's Story."""
+    html = _md.render(md)
+    story = fitz.Story(html=html, user_css=PDF_CSS)
+    buf = io.BytesIO()
+    writer = fitz.DocumentWriter(buf)
+    page = fitz.paper_rect("a4")
+    where = page + (54, 54, -54, -54)
+    more = True
+    while more:
+        device = writer.begin_page(page)
+        more, _ = story.place(where)
+        story.draw(device)
+        writer.end_page()
+    writer.close()
+    return buf.getvalue()
+
+
+def export(md: str, fmt: str) -> bytes:
+    if fmt == "md":
+        return md.encode("utf-8")
+    if fmt == "docx":
+        return to_docx(md)
+    if fmt == "pdf":
+        return to_pdf(md)
+    raise ValueError(f"Unsupported format: {fmt}")
+
+
+# ---------------- Bulk ----------------
+
+def _truthy(v) -> bool:
+    return str(v or "").strip().lower() in {"1", "true", "yes", "y", "x", "on"}
+
+
+def csv_template(doc_type: str) -> bytes:
+    """Header-only CSV with the input columns for doc_type."""
+    buf = io.StringIO()
+    csv.writer(buf).writerow(FIELDS[doc_type])
+    return buf.getvalue().encode("utf-8")
+
+
+def rows_from_csv(data: bytes, doc_type: str):
+    """Parse an uploaded CSV into draft input dicts (opt_* columns -> bool)."""
+    reader = csv.DictReader(io.StringIO(data.decode("utf-8-sig")))
+    rows = []
+    for raw in reader:
+        d = {"doc_type": doc_type}
+        for key in FIELDS[doc_type]:
+            value = raw.get(key)
+            if key.startswith("opt_") and key not in CHOICE_FIELDS:
+                d[key] = _truthy(value)
+            else:
+                d[key] = value or ""
+        rows.append(d)
+    return rows
+
+
+# Field used to name each file in a bulk export
+LABEL_FIELDS = {
+    "Mutual NDA": "party_b",
+    "One-way NDA": "party_b",
+    "Service Agreement / Freelance Contract": "contractor",
+    "Employment Offer Letter": "candidate",
+    "Demand / Notice Letter": "recipient",
+}
+
+
+def _file_stem(d: dict, i: int) -> str:
+    label = str(d.get(LABEL_FIELDS.get(d.get("doc_type"), ""), "") or "")
+    label = re.sub(r"[^A-Za-z0-9._-]+", "_", label).strip("_")[:40]
+    return f"{i:04d}_{label}" if label else f"{i:04d}"
+
+
+def _export_row(doc_type: str, d: dict, jurisdiction: str, formats, i: int):
+    md = render_document(doc_type, d, jurisdiction)
+    stem = _file_stem(d, i)
+    return [(f"{fmt}/{stem}.{fmt}", export(md, fmt)) for fmt in formats]
+
+
+def _export_rows(args):
+    # Process pool task: a run of rows, so each task amortises the pickling
+    doc_type, jurisdiction, formats, batch = args
+    return [_export_row(doc_type, d, jurisdiction, formats, i) for i, d in batch]
+
+
+def _iter_parallel(doc_type, rows, jurisdiction, formats, workers):
+    numbered = list(enumerate(rows, 1))
+    tasks = [
+        (doc_type, jurisdiction, formats, numbered[k:k + ROWS_PER_TASK])
+        for k in range(0, len(numbered), ROWS_PER_TASK)
+    ]
+    with process_pool(workers) as pool:
+        # map() yields in row order, so early rows are written while later ones convert
+        for files in pool.map(_export_rows, tasks):
+            yield from files
+
+
+def bulk_export(doc_type: str, rows, jurisdiction: str, formats=FORMATS, on_progress=None,
+                workers: int = None) -> bytes:
+    """
+    Render every input row and return a ZIP with one file per row and format.
+    DOCX/PDF conversion runs on a process pool for larger batches.
+    on_progress(done, total) is called after each row.
+    """
+    rows = list(rows)
+    formats = tuple(formats)
+    workers = MAX_WORKERS if workers is None else workers
+    parallel = workers > 1 and len(rows) >= PARALLEL_MIN_ROWS and set(formats) != {"md"}
+
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        done = 0
+
+        def _write(files):
+            nonlocal done
+            for name, data in files:
+                zf.writestr(name, data)
+            done += 1
+            if on_progress:
+                on_progress(done, len(rows))
+
+        def _serial(start):
+            for i in range(start, len(rows)):
+                yield _export_row(doc_type, rows[i], jurisdiction, formats, i + 1)
+
+        if parallel:
+            source = iter_with_fallback(_iter_parallel(doc_type, rows, jurisdiction, formats, workers), _serial)
+        else:
+            source = _serial(0)
+        for files in source:
+            _write(files)
+    return buf.getvalue()
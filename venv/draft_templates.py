@@ -0,0 +1,511 @@
+from datetime import date
+from functools import lru_cache
+from jinja2 import Environment, StrictUndefined, meta
+from clause_library import render_clause
+
+# Draft templates, split into sections. Each section is a Jinja template that is
+# compiled once at import; a section is only re-rendered when one of the
+# variables it uses changes (see _render_section).
+
+NDA_SECTIONS = [
+    """# {{ title }}
+
+**Effective Date:** {{ today }}
+
+This {{ title }} (“**Agreement**”) is entered into by and between **{{ party_a }}** and **{{ party_b }}** (each a “**Party**”, and together the “**Parties**”).
+
+""",
+    """## 1. Purpose
+The Parties wish to disclose certain confidential information for the purpose of: **{{ purpose }}** (“**Purpose**”). The {{ receiving }} agrees to receive, protect, and use such information only as permitted under this Agreement.
+
+""",
+    """## 2. Definition of Confidential Information
+“**Confidential Information**” means any non-public information disclosed by **{{ disclosing }}** to the other, whether in written, oral, visual, electronic, or other form, that is designated as confidential or that reasonably should be understood to be confidential given the nature of the information and the circumstances of disclosure.
+
+""",
+    """## 3. Exclusions
+Confidential Information does not include information that the Receiving Party can demonstrate:
+- is or becomes publicly available through no breach of this Agreement;
+- was lawfully known to the Receiving Party prior to disclosure;
+- is lawfully received from a third party without restriction;
+- is independently developed without use of Confidential Information.
+
+""",
+    """## 4. Obligations of the Receiving Party
+The Receiving Party shall:
+- use Confidential Information solely for the Purpose;
+- not disclose Confidential Information to any third party except to permitted recipients under Section 5;
+- protect Confidential Information using at least reasonable care (and no less than the care used to protect its own similar information);
+- promptly notify the Disclosing Party if it becomes aware of unauthorized disclosure.
+
+""",
+    """## 5. Permitted Recipients
+The Receiving Party may disclose Confidential Information to its employees, contractors, or advisors who have a legitimate need to know for the Purpose and are bound by confidentiality obligations at least as protective as this Agreement.
+
+""",
+    """## 6. Term and Survival
+This Agreement remains in effect until terminated by either Party with written notice. The confidentiality obligations will continue for **{{ term }}** from the date of disclosure of the Confidential Information.
+
+""",
+    """## 7. Return or Destruction
+Upon written request, the Receiving Party will return or destroy all Confidential Information, except that one archival copy may be retained for legal/compliance purposes.
+
+""",
+    """## 8. No License
+No rights or licenses are granted under this Agreement by implication or otherwise, except as expressly stated.
+
+""",
+    """## 9. Remedies
+The Parties acknowledge that unauthorized disclosure may cause irreparable harm for which monetary damages may be insufficient, and injunctive relief may be appropriate.
+
+""",
+    """## 10. Governing Law
+This Agreement shall be governed by the laws of **{{ governing }}**, without regard to conflict of law principles.
+
+""",
+    """## 11. Entire Agreement
+This Agreement constitutes the entire agreement between the Parties regarding the subject matter and supersedes prior discussions or agreements relating to Confidential Information.
+
+""",
+    """---
+
+### Signatures
+
+**{{ party_a }}**
+Name: __________________________
+Title: __________________________
+Date: __________________________
+
+**{{ party_b }}**
+Name: __________________________
+Title: __________________________
+Date: __________________________
+
+""",
+    """---
+
+*Disclaimer: LegalEase provides general information and drafting assistance only; this is not legal advice.*
+{{ optional_block }}""",
+]
+
+SERVICE_AGREEMENT_SECTIONS = [
+    """# SERVICE AGREEMENT / FREELANCE CONTRACT
+
+**Effective Date:** {{ today }}
+
+This Service Agreement (“**Agreement**”) is between **{{ client }}** (“**Client**”) and **{{ contractor }}** (“**Contractor**”).
+
+""",
+    """## 1. Services
+Contractor will perform the following services: **{{ services }}**
+
+""",
+    """## 2. Deliverables
+Expected deliverables: **{{ deliverables }}**
+
+""",
+    """## 3. Term
+Start: **{{ start_date }}**  
+End: **{{ end_date }}** (or earlier termination under this Agreement)
+
+""",
+    """## 4. Fees and Payment
+{{ fee_line }}  
+**Payment terms:** {{ payment_terms }}  
+Contractor will invoice Client as agreed (e.g., weekly, monthly, or per milestone). Client is responsible for any applicable taxes required by law.
+
+""",
+    """## 5. Independent Contractor
+Contractor is an independent contractor and not an employee, partner, or agent of Client. Contractor is responsible for their own taxes, insurance, and compliance obligations.
+
+{{ ip_clause }}
+
+""",
+    """## 8. Warranties
+Contractor represents that (i) they have the right to enter this Agreement, and (ii) to the best of their knowledge, deliverables will not knowingly infringe third-party rights. Except as stated, services are provided “as is” to the extent permitted by law.
+
+{{ conf_clause }}
+
+""",
+    """## 9. Compliance
+Each Party will comply with applicable laws relevant to performance under this Agreement.
+
+{{ term_clause }}
+
+{{ lim_liab_clause }}
+
+{{ non_solicit_clause }}
+
+""",
+    """## 12. Governing Law
+This Agreement shall be governed by the laws of **{{ governing }}**, without regard to conflict of law principles.
+
+""",
+    """## 13. Entire Agreement
+This Agreement is the entire agreement between the Parties regarding the Services and supersedes prior discussions.
+
+""",
+    """---
+
+### Signatures
+
+**{{ client }}**  
+Name: __________________________  
+Title: __________________________  
+Date: __________________________  
+
+**{{ contractor }}**  
+Name: __________________________  
+Title: __________________________  
+Date: __________________________  
+
+""",
+    """---
+
+Disclaimer: LegalEase provides general information and drafting assistance only; this is not legal advice.""",
+]
+
+OFFER_LETTER_SECTIONS = [
+    """# EMPLOYMENT OFFER LETTER
+
+**Date:** {{ today }}
+
+**To:** {{ candidate }}  
+**From:** {{ company }}
+
+Dear {{ candidate }},
+
+We are pleased to offer you the position of **{{ role }}** with **{{ company }}** on a **{{ employment_type }}** basis.
+
+""",
+    """## 1. Reporting & Work Location
+- **Reporting to:** {{ manager }}  
+- **Work location:** {{ location }}  
+- **Proposed start date:** {{ start_date }}
+
+""",
+    """## 2. Compensation
+- **Salary/Compensation:** {{ salary }} (paid {{ pay_frequency }})  
+- **Bonus/Incentives:** {{ bonus }}  
+- **Benefits:** {{ benefits }}
+
+""",
+    """## 3. Probation / Initial Period
+Your employment will be subject to an initial probation/trial period of **{{ probation }}**, during which performance and fit may be evaluated, subject to applicable law.
+
+""",
+    """## 4. Notice / Termination
+Termination and notice requirements will be **{{ notice }}**, subject to applicable law and Company policy.
+
+{{ at_will_clause }}
+
+{{ bg_clause }}
+
+{{ conf_clause }}
+
+{{ ip_clause }}
+
+{{ nca_clause }}
+
+""",
+    """## 5. Policies & Documents
+Your employment is subject to Company policies and the execution of any required documents (e.g., confidentiality, code of conduct, IP assignment), as applicable.
+
+""",
+    """## 6. Governing Law
+This offer letter will be governed by the laws of **{{ governing }}**, to the extent permitted.
+
+""",
+    """---
+
+### Acceptance
+
+If you accept this offer, please sign below and return a copy.
+
+**For {{ company }}**  
+Name: __________________________  
+Title: __________________________  
+Date: __________________________  
+
+**Accepted by {{ candidate }}**  
+Signature: ______________________  
+Name: ___________________________  
+Date: ___________________________  
+
+""",
+    """---
+
+Disclaimer: LegalEase provides general information and drafting assistance only; this is not legal advice.""",
+]
+
+NOTICE_LETTER_SECTIONS = [
+    """# DEMAND / NOTICE LETTER
+
+**Date:** {{ today }}
+
+**From:** {{ sender }}  
+{{ sender_addr }}  
+Email: {{ sender_email }}  
+
+**To:** {{ recipient }}  
+{{ recipient_addr }}  
+
+**Subject:** {{ subject }}
+
+{{ wp_line }}
+
+""",
+    """---
+
+""",
+    """## 1. Background
+{{ tone_line }}
+
+**Relationship/Context:** {{ relationship }}
+
+""",
+    """## 2. Issue / Breach
+{{ issue }}
+
+{{ amount_block }}
+
+""",
+    """## 3. Demand
+I/we hereby request that you do the following:
+
+- {{ demand }}
+{{ payment_plan_line }}{{ preserve_line }}
+
+""",
+    """## 4. Deadline
+Please comply **within {{ deadline }} days** of receipt of this notice. If you fail to comply within this time, I/we may consider pursuing appropriate remedies available under applicable law, including formal dispute resolution.
+
+""",
+    """## 5. Supporting Information
+Evidence/documents that support this matter may include:
+{{ evidence }}
+
+""",
+    """## 6. Governing Law / Jurisdiction
+This notice is issued with reference to the laws of **{{ governing }}**, to the extent applicable.
+
+""",
+    """---
+
+Sincerely,  
+**{{ sender }}**
+
+""",
+    """---
+
+Disclaimer: LegalEase provides general information and drafting assistance only; this is not legal advice.""",
+]
+
+# ---------------- Context builders ----------------
+# Turn raw form inputs (st.session_state["draft_inputs"] or a CSV row) into
+# template variables, applying defaults and picking clauses from the library.
+
+def _s(d: dict, key: str, default: str) -> str:
+    return (d.get(key) or default).strip()
+
+
+def _today() -> str:
+    return date.today().strftime("%B %d, %Y")
+
+
+def _nda_context(d: dict, jurisdiction: str) -> dict:
+    doc_type = d.get("doc_type", "Mutual NDA")
+    mutual = (doc_type == "Mutual NDA")
+
+    clause_flags = [
+        ("opt_compelled_disclosure", "nda.compelled_disclosure"),
+        ("opt_non_solicit", "nda.non_solicit"),
+        ("opt_non_compete", "nda.non_compete"),
+        ("opt_no_publicity", "nda.no_publicity"),
+        ("opt_no_assignment", "nda.no_assignment"),
+    ]
+    optional_sections = [render_clause(cid) for flag, cid in clause_flags if d.get(flag)]
+    optional_block = ""
+    if optional_sections:
+        optional_block = "\n\n---\n\n# Optional Clauses Included\n\n" + "\n\n".join(optional_sections)
+
+    return {
+        "title": "MUTUAL NON-DISCLOSURE AGREEMENT" if mutual else "NON-DISCLOSURE AGREEMENT (ONE-WAY)",
+        "today": _today(),
+        "party_a": _s(d, "party_a", "[Party A]"),
+        "party_b": _s(d, "party_b", "[Party B]"),
+        "purpose": _s(d, "purpose", "Evaluate a potential business relationship"),
+        "term": _s(d, "term", "2 years"),
+        "governing": (d.get("governing") or jurisdiction or "General / Not specified").strip(),
+        "disclosing": "each party" if mutual else "the Disclosing Party",
+        "receiving": "each party" if mutual else "the Receiving Party",
+        "optional_block": optional_block,
+    }
+
+
+def _service_agreement_context(d: dict, jurisdiction: str) -> dict:
+    fee_type = d.get("fee_type") or "Fixed"
+    fee_amount = (d.get("fee_amount") or "").strip()
+    if fee_type == "Fixed":
+        fee_line = f"**Fee:** Fixed fee of **{fee_amount or '[Amount]'}**."
+    elif fee_type == "Hourly":
+        fee_line = f"**Fee:** Hourly rate of **{fee_amount or '[Rate]'}** per hour."
+    else:
+        fee_line = f"**Fee:** Milestone-based payments totaling **{fee_amount or '[Amount]'}**."
+
+    opt_ip = d.get("opt_ip") or "Client owns deliverables"
+    ip_clause_id = {
+        "Client owns deliverables": "sa.ip.client_owns",
+        "Contractor owns; Client gets license": "sa.ip.contractor_owns",
+    }.get(opt_ip, "sa.ip.exhibit")
+
+    notice_days = _s(d, "notice_days", "7")
+    liability_cap = _s(d, "liability_cap", "Fees paid in the last 3 months")
+
+    return {
+        "today": _today(),
+        "client": _s(d, "client", "[Client]"),
+        "contractor": _s(d, "contractor", "[Contractor]"),
+        "services": _s(d, "services", "Provide professional services as described in Exhibit A."),
+        "deliverables": _s(d, "deliverables", "As agreed between the Parties in writing."),
+        "start_date": _s(d, "start_date", "Effective Date"),
+        "end_date": _s(d, "end_date", "Completion of Services"),
+        "fee_line": fee_line,
+        "payment_terms": _s(d, "payment_terms", "Net 15 days from invoice date."),
+        "governing": (d.get("governing") or jurisdiction or "General / Not specified").strip(),
+        "ip_clause": render_clause(ip_clause_id),
+        "conf_clause": render_clause("sa.confidentiality") if d.get("opt_confidentiality") else "",
+        "term_clause": render_clause("sa.termination", notice_days=notice_days) if d.get("opt_termination") else "",
+        "lim_liab_clause": (
+            render_clause("sa.limitation_of_liability", liability_cap=liability_cap)
+            if d.get("opt_lim_liability") else ""
+        ),
+        "non_solicit_clause": render_clause("sa.non_solicit") if d.get("opt_sa_non_solicit") else "",
+    }
+
+
+def _offer_letter_context(d: dict, jurisdiction: str) -> dict:
+    return {
+        "today": _today(),
+        "company": _s(d, "company", "[Company]"),
+        "candidate": _s(d, "candidate", "[Candidate]"),
+        "role": _s(d, "role", "Software Engineer"),
+        "start_date": _s(d, "ol_start_date", "To be mutually agreed"),
+        "location": _s(d, "location", "Remote / Hybrid"),
+        "manager": _s(d, "manager", "[Manager]"),
+        "employment_type": _s(d, "employment_type", "Full-time"),
+        "probation": _s(d, "probation", "3 months"),
+        "salary": _s(d, "salary", "[Compensation]"),
+        "pay_frequency": _s(d, "pay_frequency", "monthly"),
+        "bonus": _s(d, "bonus", "N/A"),
+        "benefits": _s(d, "benefits", "Standard company benefits as applicable."),
+        "notice": _s(d, "notice", "as per applicable law / company policy"),
+        "governing": (d.get("governing") or jurisdiction or "General / Not specified").strip(),
+        "at_will_clause": render_clause("ol.at_will") if d.get("opt_at_will") else "",
+        "bg_clause": render_clause("ol.background_check") if d.get("opt_bg_check") else "",
+        "conf_clause": render_clause("ol.confidentiality") if d.get("opt_ol_conf") else "",
+        "ip_clause": render_clause("ol.ip") if d.get("opt_ol_ip") else "",
+        "nca_clause": render_clause("ol.restrictive_covenants") if d.get("opt_ol_nca") else "",
+    }
+
+
+def _notice_letter_context(d: dict, jurisdiction: str) -> dict:
+    tone = _s(d, "tone", "Firm")
+    amount = _s(d, "amount", "N/A")
+    tone_line = {
+        "Polite": "This letter is sent in good faith to resolve the matter amicably.",
+        "Firm": "This letter is sent to formally notify you of the issue and request prompt resolution.",
+        "Aggressive": "This letter serves as a final notice before escalation, subject to applicable law.",
+    }.get(tone, "This letter is sent to request prompt resolution.")
+
+    return {
+        "today": _today(),
+        "sender": _s(d, "sender", "[Sender Name]"),
+        "sender_addr": _s(d, "sender_addr", "[Sender Address]"),
+        "sender_email": _s(d, "sender_email", "[Sender Email]"),
+        "recipient": _s(d, "recipient", "[Recipient Name]"),
+        "recipient_addr": _s(d, "recipient_addr", "[Recipient Address]"),
+        "subject": _s(d, "subject", "Legal Notice / Demand"),
+        "relationship": _s(d, "relationship", "The parties had a prior relationship/transaction."),
+        "issue": _s(d, "issue", "Describe the issue clearly and factually."),
+        "demand": _s(d, "demand", "State what you want the recipient to do."),
+        "deadline": _s(d, "deadline", "7"),
+        "evidence": _s(d, "evidence", "Relevant emails, invoices, messages, agreements, screenshots."),
+        "governing": (d.get("governing") or jurisdiction or "General / Not specified").strip(),
+        "tone_line": tone_line,
+        "wp_line": render_clause("notice.without_prejudice") if d.get("opt_without_prejudice") else "",
+        "payment_plan_line": render_clause("notice.payment_plan") if d.get("opt_payment_plan") else "",
+        "preserve_line": render_clause("notice.preserve_evidence") if d.get("opt_preserve_evidence") else "",
+        "amount_block": render_clause("notice.amount", amount=amount) if amount.lower() != "n/a" else "",
+    }
+
+
+# ---------------- Registry ----------------
+
+_env = Environment(autoescape=False, keep_trailing_newline=True, undefined=StrictUndefined)
+
+
+def _compile(sections):
+    compiled = []
+    for src in sections:
+        deps = tuple(sorted(meta.find_undeclared_variables(_env.parse(src))))
+        compiled.append((_env.from_string(src), deps))
+    return compiled
+
+
+# doc type -> (context builder, compiled sections)
+TEMPLATES = {
+    "Mutual NDA": (_nda_context, _compile(NDA_SECTIONS)),
+    "One-way NDA": (_nda_context, _compile(NDA_SECTIONS)),
+    "Service Agreement / Freelance Contract": (_service_agreement_context, _compile(SERVICE_AGREEMENT_SECTIONS)),
+    "Employment Offer Letter": (_offer_letter_context, _compile(OFFER_LETTER_SECTIONS)),
+    "Demand / Notice Letter": (_notice_letter_context, _compile(NOTICE_LETTER_SECTIONS)),
+}
+
+# Form fields per doc type (CSV columns for bulk export). Fields starting with
+# "opt_" are yes/no toggles.
+FIELDS = {
+    "Mutual NDA": [
+        "party_a", "party_b", "purpose", "term", "governing",
+        "opt_compelled_disclosure", "opt_non_solicit", "opt_non_compete", "opt_no_publicity", "opt_no_assignment",
+    ],
+    "Service Agreement / Freelance Contract": [
+        "client", "contractor", "services", "deliverables", "start_date", "end_date",
+        "fee_type", "fee_amount", "payment_terms", "governing", "opt_ip", "opt_confidentiality",
+        "opt_termination", "notice_days", "opt_lim_liability", "liability_cap", "opt_sa_non_solicit",
+    ],
+    "Employment Offer Letter": [
+        "company", "candidate", "role", "employment_type", "ol_start_date", "location", "manager",
+        "salary", "pay_frequency", "bonus", "benefits", "probation", "notice", "governing",
+        "opt_at_will", "opt_bg_check", "opt_ol_conf", "opt_ol_ip", "opt_ol_nca",
+    ],
+    "Demand / Notice Letter": [
+        "sender", "sender_addr", "sender_email", "recipient", "recipient_addr", "subject", "tone",
+        "relationship", "issue", "amount", "deadline", "demand", "evidence", "governing",
+        "opt_without_prejudice", "opt_payment_plan", "opt_preserve_evidence",
+    ],
+}
+FIELDS["One-way NDA"] = FIELDS["Mutual NDA"]
+
+# opt_ip is a choice, not a toggle
+CHOICE_FIELDS = {"opt_ip"}
+
+
+@lru_cache(maxsize=4096)
+def _render_section(doc_type: str, idx: int, values: tuple) -> str:
+    template, deps = TEMPLATES[doc_type][1][idx]
+    return template.render(dict(zip(deps, values)))
+
+
+def render_document(doc_type: str, d: dict, jurisdiction: str) -> str:
+    """
+    Render a template draft as Markdown. Sections whose inputs did not change
+    since a previous render are served from cache.
+    """
+    build, sections = TEMPLATES[doc_type]
+    ctx = build(d, jurisdiction)
+    parts = [
+        _render_section(doc_type, i, tuple(ctx[v] for v in deps))
+        for i, (_, deps) in enumerate(sections)
+    ]
+    return "".join(parts).strip()
@@ -0,0 +1,351 @@
+"""
+Local retrieval index for FAQ questions.
+
+BM25 over light word stems plus character trigrams, so word forms and typos
+still match. Seeded from FAQ_BANK and from previously answered questions,
+which are kept in the shared SQLite cache file (see llm_cache.py) and picked
+up incrementally, including answers written by other processes.
+"""
+import re
+import math
+import time
+import sqlite3
+import threading
+from collections import Counter, defaultdict
+
+import llm_cache
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+# Trigrams only help with typos / word forms; whole words dominate the score
+TRIGRAM_WEIGHT = 0.3
+# Cosine similarity (TF-IDF over the same terms) above which two questions
+# are treated as the same question and the stored answer is reused
+DUPLICATE_MIN = 0.8
+# Search results scoring below this share of the best hit, or below
+# MIN_SCORE (a few stray trigrams), are dropped
+RELATIVE_MIN = 0.3
+MIN_SCORE = 1.0
+
+ANSWERED_SECTION = "Previously answered"
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+# Only words that never change what is being asked. Modals ("can", "must",
+# "should"), words that double as nouns ("will") and negations carry meaning.
+_STOPWORDS = frozenset(
+    "a an the and or of to in on for at by with from as is are was were be been "
+    "it its this that these those i me my we our you your he she they them their "
+    "what which do does did if about any some there here into so".split()
+)
+
+
+def _stem(word: str) -> str:
+    if len(word) > 5 and word.endswith("ing"):
+        return word[:-3]
+    if len(word) > 4 and word.endswith("ies"):
+        return word[:-3] + "y"
+    if len(word) > 4 and word.endswith("ed"):
+        return word[:-2]
+    if len(word) > 3 and word.endswith("s") and not word.endswith(("ss", "us", "is")):
+        return word[:-1]
+    return word
+
+
+def _words(text: str):
+    return [
+        _stem(w)
+        for w in _WORD_RE.findall(llm_cache.normalize(text).replace("'", "").replace("\u2019", ""))
+        if w not in _STOPWORDS
+    ]
+
+
+def same_question(query: str, candidate: str) -> bool:
+    """
+    Guard for reusing an answer: both questions must have the same content
+    words (after stemming), which also means they agree on negation. Cosine
+    similarity alone lets "What makes a will valid?" through as "What makes
+    a contract valid?", and "Can my employer fire me?" through as "...fire me
+    during probation?".
+    """
+    return set(_words(query)) == set(_words(candidate))
+
+
+def terms(text: str) -> Counter:
+    """Term frequencies: word stems plus '#'-prefixed character trigrams."""
+    words = _words(text)
+    tf = Counter(words)
+    for w in words:
+        if len(w) > 3:
+            padded = f"^{w}$"
+            tf.update("#" + padded[i:i + 3] for i in range(len(padded) - 2))
+    return tf
+
+
+def _weight(term: str) -> float:
+    return TRIGRAM_WEIGHT if term.startswith("#") else 1.0
+
+
+class FaqIndex:
+    """
+    In-memory inverted index over FAQ questions.
+
+    version: stored answers are only reused for the same version string
+             (prompt version + model), like llm_cache keys.
+    seed:    {section: [question, ...]} indexed without answers.
+    """
+
+    def __init__(self, version: str, seed=None):
+        self.version = version
+        self._seed = seed or {}
+        self._lock = threading.RLock()
+        self._db_path = None
+        self._reset()
+        self._sync()
+
+    def _reset(self):
+        self._docs = []                      # doc id -> dict
+        self._by_key = {}                    # (jurisdiction, normalized question) -> doc id
+        self._postings = defaultdict(dict)   # term -> {doc id: tf}
+        self._total_len = 0
+        self._last_row = 0
+        for section, questions in self._seed.items():
+            for q in questions:
+                self._upsert(q, "", None, section, 0.0)
+        self._seeded = len(self._docs)
+
+    def __len__(self):
+        return len(self._docs)
+
+    # ---------------- Storage ----------------
+
+    def _db(self):
+        if not llm_cache.ENABLED:
+            return None
+        try:
+            conn = llm_cache.connection()
+            if self._db_path != llm_cache.CACHE_PATH:
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS faq_answers (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        version TEXT NOT NULL,
+                        jurisdiction TEXT NOT NULL,
+                        qnorm TEXT NOT NULL,
+                        question TEXT NOT NULL,
+                        answer TEXT NOT NULL,
+                        created REAL NOT NULL,
+                        accessed REAL NOT NULL DEFAULT 0,
+                        UNIQUE (version, jurisdiction, qnorm)
+                    )
+                    """
+                )
+                columns = {row[1] for row in conn.execute("PRAGMA table_info(faq_answers)")}
+                if "accessed" not in columns:
+                    conn.execute("ALTER TABLE faq_answers ADD COLUMN accessed REAL NOT NULL DEFAULT 0")
+                conn.execute("CREATE INDEX IF NOT EXISTS faq_answers_accessed ON faq_answers(accessed)")
+                if llm_cache.TTL_S:
+                    conn.execute("DELETE FROM faq_answers WHERE created < ?", (time.time() - llm_cache.TTL_S,))
+                self._db_path, self._last_row = llm_cache.CACHE_PATH, 0
+            return conn
+        except sqlite3.Error:
+            return None
+
+    def _sync(self):
+        # Pick up answers stored since the last sync (by any process)
+        conn = self._db()
+        if conn is None:
+            return
+        try:
+            rows = conn.execute(
+                "SELECT id, jurisdiction, question, answer, created FROM faq_answers "
+                "WHERE id > ? AND version = ? ORDER BY id",
+                (self._last_row, self.version),
+            ).fetchall()
+        except sqlite3.Error:
+            return
+        for row_id, jurisdiction, question, answer, created in rows:
+            self._upsert(question, jurisdiction, answer, ANSWERED_SECTION, created)
+            self._last_row = row_id
+
+    def _upsert(self, question: str, jurisdiction: str, answer, section: str, created: float) -> int:
+        key = (jurisdiction, llm_cache.normalize(question))
+        i = self._by_key.get(key)
+        if i is not None:
+            if answer:
+                self._docs[i].update(answer=answer, created=created)
+            return i
+
+        tf = terms(question)
+        length = sum(tf.values())
+        i = len(self._docs)
+        self._docs.append({
+            "question": question.strip(),
+            "jurisdiction": jurisdiction,
+            "section": section,
+            "answer": answer,
+            "created": created,
+            "tf": tf,
+            "len": length,
+        })
+        self._by_key[key] = i
+        self._total_len += length
+        for t, n in tf.items():
+            self._postings[t][i] = n
+        return i
+
+    def add(self, question: str, jurisdiction: str, answer: str):
+        """Index (and persist) an answered question."""
+        question = (question or "").strip()
+        if not question or not answer or answer.startswith("Error:"):
+            return
+        now = time.time()
+        with self._lock:
+            self._upsert(question, jurisdiction, answer, ANSWERED_SECTION, now)
+            conn = self._db()
+            if conn is None:
+                return
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO faq_answers "
+                    "(version, jurisdiction, qnorm, question, answer, created, accessed) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (self.version, jurisdiction, llm_cache.normalize(question), question, answer, now, now),
+                )
+                self._evict(conn)
+            except sqlite3.Error:
+                pass
+
+    def mark_used(self, question: str, jurisdiction: str):
+        """Record that a stored answer was served, for LRU eviction."""
+        conn = self._db()
+        if conn is None:
+            return
+        try:
+            conn.execute(
+                "UPDATE faq_answers SET accessed = ? WHERE version = ? AND jurisdiction = ? AND qnorm = ?",
+                (time.time(), self.version, jurisdiction, llm_cache.normalize(question)),
+            )
+        except sqlite3.Error:
+            pass
+
+    def _evict(self, conn: sqlite3.Connection):
+        # Same bound as the response cache: least-recently-used rows beyond MAX_ENTRIES
+        (count,) = conn.execute("SELECT COUNT(*) FROM faq_answers").fetchone()
+        if count <= llm_cache.MAX_ENTRIES:
+            return
+        conn.execute(
+            "DELETE FROM faq_answers WHERE id IN "
+            "(SELECT id FROM faq_answers ORDER BY accessed ASC LIMIT ?)",
+            (count - llm_cache.MAX_ENTRIES,),
+        )
+        # Evicted rows are still in memory; rebuild once well past the bound
+        if len(self._docs) - self._seeded > llm_cache.MAX_ENTRIES * 1.2:
+            self._reset()
+            self._sync()
+
+    # ---------------- Scoring ----------------
+
+    def _idf(self, term: str) -> float:
+        df = len(self._postings.get(term, ()))
+        return math.log(1 + (len(self._docs) - df + 0.5) / (df + 0.5))
+
+    def _bm25(self, tf: Counter) -> dict:
+        avg_len = self._total_len / max(1, len(self._docs))
+        scores = defaultdict(float)
+        for t in tf:
+            postings = self._postings.get(t)
+            if not postings:
+                continue
+            w = _weight(t) * self._idf(t)
+            for i, n in postings.items():
+                norm = K1 * (1 - B + B * self._docs[i]["len"] / avg_len)
+                scores[i] += w * n * (K1 + 1) / (n + norm)
+        return scores
+
+    def _cosine(self, a: Counter, b: Counter) -> float:
+        va = {t: _weight(t) * n * self._idf(t) for t, n in a.items()}
+        vb = {t: _weight(t) * n * self._idf(t) for t, n in b.items()}
+        dot = sum(v * vb.get(t, 0.0) for t, v in va.items())
+        na = math.sqrt(sum(v * v for v in va.values()))
+        nb = math.sqrt(sum(v * v for v in vb.values()))
+        return dot / (na * nb) if na and nb else 0.0
+
+    def _visible(self, doc: dict, jurisdiction) -> bool:
+        # Bank questions apply everywhere; answers only to their jurisdiction
+        return not doc["jurisdiction"] or jurisdiction is None or doc["jurisdiction"] == jurisdiction
+
+    def _fresh(self, doc: dict) -> bool:
+        return bool(doc["answer"]) and not (llm_cache.TTL_S and time.time() - doc["created"] > llm_cache.TTL_S)
+
+    # ---------------- Queries ----------------
+
+    def search(self, query: str, jurisdiction: str = None, limit: int = 10):
+        """
+        Rank indexed questions for a free-text query.
+        Returns [{"question", "section", "score", "answered"}], best first;
+        a question answered several times is listed once.
+        """
+        tf = terms(query)
+        if not tf:
+            return []
+        with self._lock:
+            self._sync()
+            scores = self._bm25(tf)
+            ranked = sorted(
+                (i for i in scores if self._visible(self._docs[i], jurisdiction)),
+                key=lambda i: -scores[i],
+            )
+            if not ranked:
+                return []
+
+            floor = max(MIN_SCORE, scores[ranked[0]] * RELATIVE_MIN)
+            out, seen = [], {}
+            for i in ranked:
+                if scores[i] < floor:
+                    break
+                doc = self._docs[i]
+                qnorm = llm_cache.normalize(doc["question"])
+                if qnorm in seen:
+                    # Same question indexed twice (bank entry and its stored answer)
+                    seen[qnorm]["answered"] = seen[qnorm]["answered"] or self._fresh(doc)
+                    continue
+                if len(out) >= limit:
+                    break
+                seen[qnorm] = {
+                    "question": doc["question"],
+                    "section": doc["section"],
+                    "score": round(scores[i], 3),
+                    "answered": self._fresh(doc),
+                }
+                out.append(seen[qnorm])
+            return out
+
+    def duplicates(self, question: str, jurisdiction: str, candidates: int = 5):
+        """
+        Indexed questions that ask the same thing as question, most similar first.
+        Returns [{"question", "answer", "similarity"}]; answer is None for
+        bank questions that have not been answered in this jurisdiction yet.
+        """
+        tf = terms(question)
+        if not tf:
+            return []
+        with self._lock:
+            self._sync()
+            scores = self._bm25(tf)
+            top = sorted(
+                (i for i in scores if self._visible(self._docs[i], jurisdiction)),
+                key=lambda i: -scores[i],
+            )[:candidates]
+            out = []
+            for i in top:
+                doc = self._docs[i]
+                sim = self._cosine(tf, doc["tf"])
+                if sim >= DUPLICATE_MIN and same_question(question, doc["question"]):
+                    out.append({
+                        "question": doc["question"],
+                        "answer": doc["answer"] if self._fresh(doc) else None,
+                        "similarity": round(sim, 3),
+                    })
+            out.sort(key=lambda d: -d["similarity"])
+            return out
@@ -0,0 +1,157 @@
+import os
+import re
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+
+# SQLite file shared by every session and worker process on this machine.
+CACHE_PATH = os.getenv(
+    "LEGALEASE_CACHE_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "llm_cache.sqlite3"),
+)
+TTL_S = int(os.getenv("LEGALEASE_CACHE_TTL", str(7 * 24 * 3600)))
+MAX_ENTRIES = int(os.getenv("LEGALEASE_CACHE_MAX_ENTRIES", "5000"))
+ENABLED = os.getenv("LEGALEASE_CACHE", "1") != "0"
+
+_local = threading.local()
+_init_lock = threading.Lock()
+_initialized = set()
+
+
+def normalize(text: str) -> str:
+    # Case/whitespace differences should not produce different cache keys
+    return re.sub(r"\s+", " ", (text or "")).strip().lower()
+
+
+def cache_key(template_version: str, model: str, temperature: float, jurisdiction: str, *inputs) -> str:
+    payload = json.dumps(
+        [template_version, model, round(float(temperature), 3), jurisdiction, [normalize(x) for x in inputs]],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _conn() -> sqlite3.Connection:
+    conn = getattr(_local, "conn", None)
+    if conn is not None and getattr(_local, "path", None) == CACHE_PATH:
+        return conn
+
+    os.makedirs(os.path.dirname(CACHE_PATH) or ".", exist_ok=True)
+    conn = sqlite3.connect(CACHE_PATH, timeout=10, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+
+    with _init_lock:
+        if CACHE_PATH not in _initialized:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    created REAL NOT NULL,
+                    accessed REAL NOT NULL
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses(accessed)")
+            _initialized.add(CACHE_PATH)
+
+    _local.conn = conn
+    _local.path = CACHE_PATH
+    return conn
+
+
+def connection() -> sqlite3.Connection:
+    """This thread's connection to the cache file, for modules that keep their own tables."""
+    return _conn()
+
+
+def get(key: str):
+    if not ENABLED:
+        return None
+    try:
+        conn = _conn()
+        row = conn.execute("SELECT value, created FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        value, created = row
+        now = time.time()
+        if TTL_S and now - created > TTL_S:
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            return None
+        conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+        return value
+    except sqlite3.Error:
+        # The cache is an optimisation; never let it break a request
+        return None
+
+
+def put(key: str, value: str):
+    if not ENABLED or not value:
+        return
+    try:
+        conn = _conn()
+        now = time.time()
+        conn.execute(
+            "INSERT OR REPLACE INTO responses (key, value, created, accessed) VALUES (?, ?, ?, ?)",
+            (key, value, now, now),
+        )
+        _evict(conn)
+    except sqlite3.Error:
+        pass
+
+
+def _evict(conn: sqlite3.Connection):
+    # Drop expired rows, then least-recently-used rows beyond MAX_ENTRIES
+    if TTL_S:
+        conn.execute("DELETE FROM responses WHERE created < ?", (time.time() - TTL_S,))
+    (count,) = conn.execute("SELECT COUNT(*) FROM responses").fetchone()
+    if count > MAX_ENTRIES:
+        conn.execute(
+            "DELETE FROM responses WHERE key IN "
+            "(SELECT key FROM responses ORDER BY accessed ASC LIMIT ?)",
+            (count - MAX_ENTRIES,),
+        )
+
+
+def clear():
+    try:
+        _conn().execute("DELETE FROM responses")
+    except sqlite3.Error:
+        pass
+
+
+def cached(key: str, compute):
+    """
+    Return the cached value for key, or compute() and store it.
+    Error strings ("Error: ...") are never cached.
+    """
+    hit = get(key)
+    if hit is not None:
+        return hit
+    value = compute()
+    if value and not value.startswith("Error:"):
+        put(key, value)
+    return value
+
+
+def cached_stream(key: str, stream):
+    """
+    Streaming counterpart of cached(): yields the cached value in one chunk,
+    or relays stream() and stores the full text once it completes.
+    A stream that is closed early (cancelled) is not cached.
+    """
+    hit = get(key)
+    if hit is not None:
+        yield hit
+        return
+    parts = []
+    for chunk in stream():
+        parts.append(chunk)
+        yield chunk
+    value = "".join(parts).strip()
+    failed = parts and parts[-1].lstrip().startswith("Error:")
+    if value and not failed:
+        put(key, value)
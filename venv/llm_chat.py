@@ -0,0 +1,79 @@
+from llm_client import has_api_key, safe_generate_text, safe_generate_stream, MISSING_KEY_MSG
+from chat_memory import prepare_history, update_memory, to_contents
+
+
+def _build_prompt(user_query: str, jurisdiction: str, summary: str = "") -> str:
+    earlier = f"\nEarlier conversation (summary):\n{summary}\n" if summary else ""
+    return f"""
+You are LegalEase, an AI legal information assistant (not a lawyer).
+
+Rules:
+- Provide general educational information only, not legal advice.
+- Laws vary by jurisdiction; be cautious and state assumptions.
+- Do NOT help with wrongdoing (fraud, forgery, evasion, harassment, violence).
+- If the situation seems urgent/high-stakes, advise consulting a licensed attorney.
+- Keep the response clear and structured.
+
+Context:
+Jurisdiction: {jurisdiction}
+{earlier}
+User question:
+{user_query}
+
+Respond in this format:
+1) Plain-English explanation : (3–6 lines)
+2) Practical checklist :- (5–10 bullets)
+3) Red flags / common mistakes :- (3–7 bullets)
+4) What info a lawyer would ask for? (max 6 bullets)
+5) Disclaimer :- (one line)
+""".strip()
+
+
+def _build_contents(user_query: str, jurisdiction: str, history, memory):
+    """
+    Single prompt when there is no history; otherwise prior turns as structured
+    contents (recent ones verbatim, older ones via the running summary).
+    """
+    if not history:
+        return _build_prompt(user_query, jurisdiction)
+
+    summary, recent = prepare_history(history, memory if memory is not None else {})
+    contents = to_contents(recent)
+    contents.append({"role": "user", "parts": [{"text": _build_prompt(user_query, jurisdiction, summary)}]})
+    return contents
+
+
+def remember(messages, memory):
+    """
+    Roll older turns into memory's running summary. messages is the whole
+    chat ending with the latest answer; call it once that answer is stored,
+    since it may make a (summary) model call.
+    """
+    if memory is None or not messages or not messages[-1]["content"] \
+            or messages[-1]["content"].lstrip().startswith("Error:"):
+        return
+    update_memory(messages, memory)
+
+
+def ask_gemini(user_query: str, jurisdiction: str, history=None, memory=None) -> str:
+    if not has_api_key():
+        return f"Error: {MISSING_KEY_MSG}"
+
+    contents = _build_contents(user_query, jurisdiction, history, memory)
+    answer = safe_generate_text(contents, temperature=0.2)
+    turn = [{"role": "user", "content": user_query}, {"role": "assistant", "content": answer}]
+    remember(list(history or []) + turn, memory)
+    return answer
+
+
+def ask_gemini_stream(user_query: str, jurisdiction: str, history=None, memory=None):
+    """
+    Yields the answer in chunks as Gemini produces them. memory is only read;
+    store the answer, then call remember() to update it.
+    """
+    if not has_api_key():
+        yield f"Error: {MISSING_KEY_MSG}"
+        return
+
+    contents = _build_contents(user_query, jurisdiction, history, memory)
+    yield from safe_generate_stream(contents, temperature=0.2)
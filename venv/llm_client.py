@@ -0,0 +1,322 @@
+import os
+import time
+import random
+import threading
+from dotenv import load_dotenv
+from google import genai
+from google.genai import errors as genai_errors
+
+load_dotenv()
+
+MODEL = "gemini-2.5-flash"
+MISSING_KEY_MSG = "GEMINI_API_KEY is missing. Put it in your .env."
+
+# Tunables (env overrides so deployments can adjust without code changes)
+TIMEOUT_S = float(os.getenv("LEGALEASE_LLM_TIMEOUT", "60"))
+MAX_RETRIES = int(os.getenv("LEGALEASE_LLM_RETRIES", "4"))
+BACKOFF_BASE_S = float(os.getenv("LEGALEASE_LLM_BACKOFF", "1.0"))
+BACKOFF_MAX_S = float(os.getenv("LEGALEASE_LLM_BACKOFF_MAX", "20"))
+MAX_IN_FLIGHT = int(os.getenv("LEGALEASE_LLM_CONCURRENCY", "4"))
+# Requests per minute per process (0 = unlimited); useful for batch jobs
+MAX_RPM = float(os.getenv("LEGALEASE_LLM_RPM", "0"))
+
+# Optional: point the SDK at a local fake model server (offline testing)
+BASE_URL = os.getenv("GEMINI_BASE_URL", "").strip()
+
+RETRYABLE_CODES = {408, 429, 500, 502, 503, 504}
+
+_client = None
+_client_key = None
+_client_lock = threading.Lock()
+_slots = threading.BoundedSemaphore(MAX_IN_FLIGHT)
+
+# In-process fake backend, see set_backend()
+_backend = None
+
+_rate_lock = threading.Lock()
+_next_slot_at = 0.0
+
+
+class LLMError(RuntimeError):
+    pass
+
+
+def set_backend(fn):
+    """
+    Route all calls to fn(model, contents, config) instead of Gemini.
+    fn returns either a str or an object with a .text attribute.
+    Pass None to go back to the real client.
+    """
+    global _backend
+    _backend = fn
+
+
+def set_rate_limit(rpm: float):
+    """Cap calls per minute for this process (0 or None = unlimited)."""
+    global MAX_RPM
+    MAX_RPM = float(rpm or 0)
+
+
+def _wait_for_rate_slot():
+    # Spaces calls evenly at 60/MAX_RPM seconds apart, across all threads,
+    # and honours any cool-down set after a 429
+    global _next_slot_at
+    with _rate_lock:
+        now = time.monotonic()
+        slot = max(now, _next_slot_at)
+        if MAX_RPM > 0:
+            _next_slot_at = slot + 60.0 / MAX_RPM
+    if slot > now:
+        time.sleep(slot - now)
+
+
+def _cool_down(seconds: float):
+    # After a 429, hold back every thread in this process, not just the caller
+    global _next_slot_at
+    with _rate_lock:
+        _next_slot_at = max(_next_slot_at, time.monotonic() + seconds)
+
+
+def has_api_key() -> bool:
+    return _backend is not None or bool(os.getenv("GEMINI_API_KEY"))
+
+
+def backend_name(model: str = MODEL) -> str:
+    """Which model answers calls: the Gemini model name, or "fake:<fn>" under set_backend()."""
+    if _backend is not None:
+        return "fake:" + getattr(_backend, "__name__", type(_backend).__name__)
+    return model
+
+
+def get_client():
+    """
+    One shared genai.Client per process, so the underlying HTTP connection
+    pool (and TLS sessions) are reused across requests.
+    """
+    global _client, _client_key
+    api_key = os.getenv("GEMINI_API_KEY")
+    if not api_key:
+        raise LLMError(MISSING_KEY_MSG)
+
+    with _client_lock:
+        if _client is None or _client_key != api_key:
+            http_options = {"timeout": int(TIMEOUT_S * 1000)}
+            if BASE_URL:
+                http_options["base_url"] = BASE_URL
+            _client = genai.Client(api_key=api_key, http_options=http_options)
+            _client_key = api_key
+        return _client
+
+
+def reset_client():
+    global _client, _client_key
+    with _client_lock:
+        _client = None
+        _client_key = None
+
+
+# ---------------- Stats ----------------
+
+class _Stats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.calls = 0
+            self.errors = 0
+            self.retries = 0
+            self.prompt_tokens = 0
+            self.output_tokens = 0
+            self.total_latency_s = 0.0
+            self.last_latency_s = 0.0
+
+    def record(self, latency_s: float, usage=None, ok: bool = True):
+        with self._lock:
+            self.calls += 1
+            if not ok:
+                self.errors += 1
+            self.total_latency_s += latency_s
+            self.last_latency_s = latency_s
+            if usage is not None:
+                self.prompt_tokens += getattr(usage, "prompt_token_count", 0) or 0
+                self.output_tokens += getattr(usage, "candidates_token_count", 0) or 0
+
+    def add_retry(self):
+        with self._lock:
+            self.retries += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            avg = (self.total_latency_s / self.calls) if self.calls else 0.0
+            return {
+                "calls": self.calls,
+                "errors": self.errors,
+                "retries": self.retries,
+                "prompt_tokens": self.prompt_tokens,
+                "output_tokens": self.output_tokens,
+                "avg_latency_s": round(avg, 3),
+                "last_latency_s": round(self.last_latency_s, 3),
+            }
+
+
+stats = _Stats()
+
+
+# ---------------- Calls ----------------
+
+def _is_retryable(e: Exception) -> bool:
+    if isinstance(e, genai_errors.APIError):
+        return getattr(e, "code", None) in RETRYABLE_CODES
+    # Network-level failures (timeouts, dropped connections) from httpx
+    name = type(e).__name__
+    return name.endswith("Timeout") or name in {"ConnectError", "ReadError", "RemoteProtocolError"}
+
+
+def _backoff(attempt: int) -> float:
+    # Full jitter: sleep somewhere in [0, min(cap, base * 2^attempt)]
+    return random.uniform(0, min(BACKOFF_MAX_S, BACKOFF_BASE_S * (2 ** attempt)))
+
+
+def _retry_pause(e: Exception, attempt: int):
+    stats.add_retry()
+    delay = _backoff(attempt)
+    if getattr(e, "code", None) == 429:
+        _cool_down(delay)
+    time.sleep(delay)
+
+
+def _call(model: str, contents, config: dict):
+    if _backend is not None:
+        resp = _backend(model, contents, config)
+        if isinstance(resp, str):
+            return _FakeResponse(resp)
+        return resp
+    return get_client().models.generate_content(model=model, contents=contents, config=config)
+
+
+class _FakeResponse:
+    def __init__(self, text: str):
+        self.text = text
+        self.usage_metadata = None
+
+
+def _config(temperature: float, system_instruction: str = None) -> dict:
+    config = {"temperature": temperature}
+    if system_instruction:
+        config["system_instruction"] = system_instruction
+    return config
+
+
+def generate_text(contents, temperature: float = 0.2, model: str = MODEL,
+                  system_instruction: str = None) -> str:
+    """
+    Run one generate_content call through the shared client.
+    Applies the per-process concurrency cap, timeouts and jittered retries.
+    Raises LLMError if the key is missing or all retries fail.
+    """
+    if not has_api_key():
+        raise LLMError(MISSING_KEY_MSG)
+
+    config = _config(temperature, system_instruction)
+    attempt = 0
+    while True:
+        _wait_for_rate_slot()
+        t0 = time.perf_counter()
+        try:
+            with _slots:
+                resp = _call(model, contents, config)
+        except Exception as e:
+            stats.record(time.perf_counter() - t0, ok=False)
+            if attempt < MAX_RETRIES and _is_retryable(e):
+                _retry_pause(e, attempt)
+                attempt += 1
+                continue
+            raise LLMError(str(e)) from e
+
+        stats.record(time.perf_counter() - t0, getattr(resp, "usage_metadata", None))
+        return (resp.text or "").strip()
+
+
+def _call_stream(model: str, contents, config: dict):
+    if _backend is not None:
+        resp = _backend(model, contents, config)
+        if isinstance(resp, str):
+            return iter([_FakeResponse(resp)])
+        if hasattr(resp, "text"):
+            return iter([resp])
+        return (_FakeResponse(c) if isinstance(c, str) else c for c in resp)
+    return get_client().models.generate_content_stream(model=model, contents=contents, config=config)
+
+
+def generate_stream(contents, temperature: float = 0.2, model: str = MODEL,
+                    system_instruction: str = None):
+    """
+    Streaming version of generate_text: yields text chunks as they arrive.
+    Retries only happen before the first chunk; the concurrency slot is held
+    until the stream is exhausted or closed (e.g. the page reruns / user cancels).
+    """
+    if not has_api_key():
+        raise LLMError(MISSING_KEY_MSG)
+
+    config = _config(temperature, system_instruction)
+    attempt = 0
+    while True:
+        _wait_for_rate_slot()
+        t0 = time.perf_counter()
+        started = False
+        usage = None
+        try:
+            with _slots:
+                for chunk in _call_stream(model, contents, config):
+                    usage = getattr(chunk, "usage_metadata", None) or usage
+                    text = chunk.text or ""
+                    if text:
+                        started = True
+                        yield text
+        except GeneratorExit:
+            stats.record(time.perf_counter() - t0, usage)
+            raise
+        except Exception as e:
+            stats.record(time.perf_counter() - t0, ok=False)
+            if not started and attempt < MAX_RETRIES and _is_retryable(e):
+                _retry_pause(e, attempt)
+                attempt += 1
+                continue
+            raise LLMError(str(e)) from e
+
+        stats.record(time.perf_counter() - t0, usage)
+        return
+
+
+def safe_generate_stream(contents, temperature: float = 0.2, model: str = MODEL,
+                         system_instruction: str = None):
+    """Same as generate_stream, but yields an "Error: ..." chunk instead of raising."""
+    started = False
+    try:
+        for chunk in generate_stream(contents, temperature, model, system_instruction):
+            started = True
+            yield chunk
+    except LLMError as e:
+        yield f"\n\nError: {e}" if started else f"Error: {e}"
+
+
+def safe_generate_text(contents, temperature: float = 0.2, model: str = MODEL,
+                       system_instruction: str = None) -> str:
+    """Same as generate_text, but returns an "Error: ..." string instead of raising."""
+    try:
+        return generate_text(contents, temperature, model, system_instruction)
+    except LLMError as e:
+        return f"Error: {e}"
+
+
+# ---------------- Offline fake ----------------
+
+def echo_backend(model, contents, config) -> str:
+    """
+    Tiny deterministic stand-in for Gemini, useful for offline runs:
+        set_backend(echo_backend)
+    """
+    text = contents if isinstance(contents, str) else str(contents)
+    return f"[fake {model}] " + text[-200:]
@@ -0,0 +1,153 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from llm_client import has_api_key, safe_generate_text, safe_generate_stream, MISSING_KEY_MSG, MODEL
+from faq_index import FaqIndex
+import llm_cache
+
+# Bump whenever the prompt below changes so old cached answers are not reused
+PROMPT_VERSION = "faq-v1"
+TEMPERATURE = 0.2
+
+FAQ_BANK = {
+    "Contracts & Agreements": [
+        "What makes a contract legally valid?",
+        "What should I check before signing an NDA?",
+        "What are common red flags in freelance/service agreements?",
+        "What does 'termination for convenience' mean?",
+        "What does 'limitation of liability' mean in simple terms?",
+    ],
+    "Employment": [
+        "What should an offer letter include?",
+        "What is probation/trial period and what should I clarify?",
+        "What are common issues in employment contracts?",
+    ],
+    "Payments & Disputes": [
+        "What should I do if someone is not paying an invoice?",
+        "How do I write a notice/demand letter without escalating too hard?",
+        "What evidence should I keep for a payment dispute?",
+    ],
+    "Privacy & Data": [
+        "What is personal data and why does it matter in agreements?",
+        "What clauses should be in a simple privacy policy (high-level)?",
+    ],
+}
+
+
+def _build_prompt(question: str, jurisdiction: str) -> str:
+    return f"""
+You are LegalEase, an AI legal information assistant (not a lawyer).
+
+Answer the user's legal question in a clear, beginner-friendly way.
+Constraints:
+- Not legal advice. Provide general educational information.
+- Ask 2–4 clarifying questions if needed.
+- Give practical next steps (non-legal-advice).
+- Mention jurisdiction differences if relevant, but avoid claiming specific statutes.
+- Output MUST be Markdown.
+- End with: "Disclaimer: This is not legal advice."
+
+Jurisdiction: {jurisdiction}
+
+Question: {question}
+""".strip()
+
+
+def _key(question: str, jurisdiction: str) -> str:
+    return llm_cache.cache_key(PROMPT_VERSION, MODEL, TEMPERATURE, jurisdiction, question)
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def faq_index() -> FaqIndex:
+    """Shared FAQ index, built on first use from FAQ_BANK plus stored answers."""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = FaqIndex(f"{PROMPT_VERSION}:{MODEL}", FAQ_BANK)
+    return _index
+
+
+def search_faq(query: str, jurisdiction: str, limit: int = 10):
+    """Fuzzy-ranked FAQ_BANK and previously answered questions for query."""
+    return faq_index().search(query, jurisdiction, limit)
+
+
+def lookup_answer(question: str, jurisdiction: str):
+    """
+    Stored answer for question or a near-duplicate of it, without calling the model.
+    Returns (matched_question, answer) or None.
+    """
+    hit = llm_cache.get(_key(question, jurisdiction))
+    if hit is not None:
+        return question, hit
+    index = faq_index()
+    for match in index.duplicates(question, jurisdiction):
+        if match["answer"]:
+            index.mark_used(match["question"], jurisdiction)
+            return match["question"], match["answer"]
+        # Bank questions may be answered only in the response cache (e.g. prewarm)
+        answer = llm_cache.get(_key(match["question"], jurisdiction))
+        if answer:
+            return match["question"], answer
+    return None
+
+
+def answer_faq(question: str, jurisdiction: str) -> str:
+    if not has_api_key():
+        return f"Error: {MISSING_KEY_MSG}"
+
+    found = lookup_answer(question, jurisdiction)
+    if found:
+        return found[1]
+
+    answer = llm_cache.cached(
+        _key(question, jurisdiction),
+        lambda: safe_generate_text(_build_prompt(question, jurisdiction), temperature=TEMPERATURE),
+    )
+    faq_index().add(question, jurisdiction, answer)
+    return answer
+
+
+def answer_faq_stream(question: str, jurisdiction: str):
+    """Streaming answer_faq; stored answers come back as a single chunk."""
+    if not has_api_key():
+        yield f"Error: {MISSING_KEY_MSG}"
+        return
+
+    found = lookup_answer(question, jurisdiction)
+    if found:
+        yield found[1]
+        return
+
+    parts = []
+    for chunk in llm_cache.cached_stream(
+        _key(question, jurisdiction),
+        lambda: safe_generate_stream(_build_prompt(question, jurisdiction), temperature=TEMPERATURE),
+    ):
+        parts.append(chunk)
+        yield chunk
+    if parts and not parts[-1].lstrip().startswith("Error:"):
+        faq_index().add(question, jurisdiction, "".join(parts).strip())
+
+
+def prewarm_faq_cache(jurisdictions, max_workers: int = 4) -> int:
+    """
+    Fill the cache for every FAQ_BANK question x jurisdiction.
+    Already-cached pairs are skipped. Returns how many answers were generated.
+    """
+    if not has_api_key():
+        return 0
+
+    todo = [
+        (q, j)
+        for qs in FAQ_BANK.values()
+        for q in qs
+        for j in jurisdictions
+        if llm_cache.get(_key(q, j)) is None
+    ]
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        list(pool.map(lambda qj: answer_faq(*qj), todo))
+    return len(todo)
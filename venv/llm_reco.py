@@ -0,0 +1,75 @@
+import json
+from llm_client import has_api_key, generate_text, LLMError, MISSING_KEY_MSG, MODEL
+import llm_cache
+
+# Bump whenever the prompt below changes so old cached answers are not reused
+PROMPT_VERSION = "reco-v1"
+TEMPERATURE = 0.2
+
+DOC_TYPES = [
+    "Mutual NDA",
+    "One-way NDA",
+    "Service Agreement / Freelance Contract",
+    "Employment Offer Letter",
+    "Consulting Agreement",
+    "Partnership Agreement",
+    "Rental Agreement / Addendum",
+    "Demand / Notice Letter",
+    "MoU (Memorandum of Understanding)",
+    "Invoice / Payment Terms Addendum",
+    "Other (custom)"
+]
+
+def recommend_doc(user_query: str, jurisdiction: str) -> dict:
+    if not has_api_key():
+        return {"error": MISSING_KEY_MSG}
+
+    prompt = f"""
+You are LegalEase, an AI legal information assistant (not a lawyer).
+
+Task:
+Recommend the most suitable legal document type based on the user's query.
+Be conservative and jurisdiction-aware. If uncertain, ask clarifying questions.
+
+Jurisdiction: {jurisdiction}
+User query: {user_query}
+
+Return STRICT JSON only (no extra text) with this schema:
+{{
+  "recommended_document": "<one of: {DOC_TYPES}>",
+  "alternatives": ["<up to 3 from list>"],
+  "why_this_document": ["<3-6 bullets as strings>"],
+  "required_information": ["<fields user must provide>"],
+  "follow_up_questions": ["<up to 5 questions if needed>"],
+  "risk_notes": ["<up to 5 red-flag notes>"]
+}}
+
+Rules:
+- The recommended_document must be exactly one of the allowed doc types.
+- If user asks for something illegal or suspicious, set recommended_document to "Other (custom)" and include a refusal-style risk note.
+""".strip()
+
+    key = llm_cache.cache_key(PROMPT_VERSION, MODEL, TEMPERATURE, jurisdiction, user_query)
+    raw = llm_cache.get(key)
+    fresh = raw is None
+    if fresh:
+        try:
+            raw = generate_text(prompt, temperature=TEMPERATURE)
+        except LLMError as e:
+            return {"error": f"Model call failed: {e}"}
+
+    # Defensive JSON extraction
+    start = raw.find("{")
+    end = raw.rfind("}")
+    if start == -1 or end == -1 or end <= start:
+        return {"error": "Model did not return JSON.", "raw": raw}
+
+    try:
+        data = json.loads(raw[start:end+1])
+    except json.JSONDecodeError:
+        return {"error": "Invalid JSON returned.", "raw": raw}
+
+    # Only cache output that parsed, so a bad response gets retried next time
+    if fresh:
+        llm_cache.put(key, raw)
+    return data
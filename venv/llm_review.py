@@ -0,0 +1,399 @@
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from llm_client import has_api_key, safe_generate_text, safe_generate_stream, MISSING_KEY_MSG, MODEL
+import llm_cache
+
+# Bump whenever the prompt below changes so old cached reviews are not reused
+PROMPT_VERSION = "review-v1"
+CHUNK_PROMPT_VERSION = "review-chunk-v2"
+MERGE_PROMPT_VERSION = "review-merge-v1"
+TEMPERATURE = 0.2
+
+# Long-document mode: texts above LONG_DOC_CHARS are reviewed chunk by chunk
+LONG_DOC_CHARS = 40000
+CHUNK_CHARS = 12000
+MERGE_CHARS = 30000
+MAX_WORKERS = 4
+
+# Lines that usually start a new clause/section in contracts
+_SECTION_RE = re.compile(
+    r"^\s*(?:"
+    r"#{1,6}\s"                                          # Markdown heading
+    r"|(?:ARTICLE|Article|SECTION|Section|CLAUSE|Clause|SCHEDULE|Schedule|EXHIBIT|Exhibit|ANNEX|Annex)\s+[\dIVXLC]+"
+    r"|\d{1,2}(?:\.\d{1,2})*[.)]?\s+[A-Z]"                # 1. Term / 4.2 Fees
+    r"|[A-Z][A-Z &/,\-]{6,}$"                             # ALL-CAPS heading line
+    r")",
+    re.MULTILINE,
+)
+
+def _clean(s: str) -> str:
+    s = (s or "").strip()
+    s = re.sub(r"\n{3,}", "\n\n", s)
+    return s
+
+def _build_prompt(text: str, jurisdiction: str, doc_type_hint: str) -> str:
+    return f"""
+You are LegalEase, an AI legal information assistant (not a lawyer).
+
+Task: Review the document text and produce a structured analysis.
+Constraints:
+- Do NOT provide legal advice; provide general informational analysis.
+- Do NOT invent text not present. If something is missing/unclear, say so.
+- Limit the summary to 5-6 bullets max.
+- If the document is too long, focus on the most important parts and say it's truncated.
+- Output MUST be Markdown only.
+- Keep it concise but useful.
+
+Context:
+Jurisdiction: {jurisdiction}
+Document type hint (may be empty): {doc_type_hint}
+
+Return in EXACT sections with these headings:
+
+## Summary
+- ...
+
+## Key Clauses / Terms
+- Parties:
+- Dates:
+- Payment:
+- Term & termination:
+- Confidentiality:
+- IP / ownership:
+- Liability / indemnity:
+- Dispute resolution / governing law:
+(If not found, write "Not found / unclear".)
+
+## Risks / Red Flags
+- ...
+
+## Suggested Improvements / Questions to Ask
+- ...
+
+End with: "Disclaimer: This is not legal advice."
+
+DOCUMENT TEXT:
+---
+{text}
+---
+""".strip()
+
+
+def _key(text: str, jurisdiction: str, doc_type_hint: str) -> str:
+    return llm_cache.cache_key(PROMPT_VERSION, MODEL, TEMPERATURE, jurisdiction, doc_type_hint, text)
+
+
+def review_document(text: str, jurisdiction: str, doc_type_hint: str = "") -> str:
+    if not has_api_key():
+        return f"Error: {MISSING_KEY_MSG}"
+
+    text = _clean(text)
+    if not text:
+        return "Error: No document text found."
+
+    prompt = _build_prompt(text, jurisdiction, doc_type_hint)
+    return llm_cache.cached(
+        _key(text, jurisdiction, doc_type_hint),
+        lambda: safe_generate_text(prompt, temperature=TEMPERATURE),
+    )
+
+
+def review_document_stream(text: str, jurisdiction: str, doc_type_hint: str = ""):
+    """Streaming review_document; cached reviews come back as a single chunk."""
+    if not has_api_key():
+        yield f"Error: {MISSING_KEY_MSG}"
+        return
+
+    text = _clean(text)
+    if not text:
+        yield "Error: No document text found."
+        return
+
+    prompt = _build_prompt(text, jurisdiction, doc_type_hint)
+    yield from llm_cache.cached_stream(
+        _key(text, jurisdiction, doc_type_hint),
+        lambda: safe_generate_stream(prompt, temperature=TEMPERATURE),
+    )
+
+
+
+# ---------------- Long-document (map-reduce) mode ----------------
+
+def _split_sections(text: str):
+    starts = [m.start() for m in _SECTION_RE.finditer(text)]
+    if not starts or starts[0] != 0:
+        starts.insert(0, 0)
+    starts.append(len(text))
+    return [text[a:b].strip() for a, b in zip(starts, starts[1:]) if text[a:b].strip()]
+
+
+def _split_oversized(section: str, max_chars: int):
+    # Fall back to paragraph boundaries, then a hard cut, for very long sections
+    if len(section) <= max_chars:
+        return [section]
+    out, cur = [], ""
+    for para in re.split(r"\n\s*\n", section):
+        while len(para) > max_chars:
+            if cur:
+                out.append(cur)
+                cur = ""
+            out.append(para[:max_chars])
+            para = para[max_chars:]
+        if cur and len(cur) + len(para) + 2 > max_chars:
+            out.append(cur)
+            cur = ""
+        cur = f"{cur}\n\n{para}" if cur else para
+    if cur:
+        out.append(cur)
+    return out
+
+
+def iter_chunks(blocks, max_chars: int = CHUNK_CHARS):
+    """
+    Turn an iterable of text blocks (e.g. PDF pages as they are extracted)
+    into chunks of at most max_chars, cutting at clause/section headings
+    where possible. Chunks are yielded as soon as they are complete.
+    """
+    buf, cur = "", ""
+
+    def pack(sections):
+        nonlocal cur
+        for section in sections:
+            for piece in _split_oversized(section, max_chars):
+                if cur and len(cur) + len(piece) + 2 > max_chars:
+                    yield cur
+                    cur = ""
+                cur = f"{cur}\n\n{piece}" if cur else piece
+
+    for block in blocks:
+        block = _clean(block)
+        if not block:
+            continue
+        buf = f"{buf}\n\n{block}" if buf else block
+        if len(buf) < 2 * max_chars:
+            continue
+        sections = _split_sections(buf)
+        # The last section may continue on the next page; hold it back
+        buf = sections.pop() if len(sections) > 1 else ""
+        yield from pack(sections)
+
+    if buf:
+        yield from pack(_split_sections(buf))
+    if cur:
+        yield cur
+
+
+def split_into_chunks(text: str, max_chars: int = CHUNK_CHARS):
+    return list(iter_chunks([text], max_chars))
+
+
+def _build_chunk_prompt(chunk: str, idx: int, jurisdiction: str, doc_type_hint: str) -> str:
+    return f"""
+You are LegalEase, an AI legal information assistant (not a lawyer).
+
+Task: You are reviewing PART {idx} of a longer document.
+Extract findings from THIS PART ONLY; another step will merge all parts.
+Constraints:
+- Do NOT provide legal advice; provide general informational analysis.
+- Do NOT invent text not present. Only report what this part contains.
+- Quote or cite the clause/section number when possible.
+- Output MUST be Markdown only. Be terse; skip headings with nothing to report.
+
+Context:
+Jurisdiction: {jurisdiction}
+Document type hint (may be empty): {doc_type_hint}
+
+Use these headings:
+
+## Summary
+- (1-3 bullets about what this part covers)
+
+## Key Clauses / Terms
+- Parties / Dates / Payment / Term & termination / Confidentiality / IP / ownership / Liability / indemnity / Dispute resolution / governing law (only those present)
+
+## Risks / Red Flags
+- ...
+
+## Suggested Improvements / Questions to Ask
+- ...
+
+DOCUMENT PART {idx}:
+---
+{chunk}
+---
+""".strip()
+
+
+def _build_merge_prompt(findings: str, jurisdiction: str, doc_type_hint: str, final: bool) -> str:
+    if final:
+        shape = """Return in EXACT sections with these headings:
+
+## Summary
+- ...
+
+## Key Clauses / Terms
+- Parties:
+- Dates:
+- Payment:
+- Term & termination:
+- Confidentiality:
+- IP / ownership:
+- Liability / indemnity:
+- Dispute resolution / governing law:
+(If not found, write "Not found / unclear".)
+
+## Risks / Red Flags
+- ...
+
+## Suggested Improvements / Questions to Ask
+- ...
+
+End with: "Disclaimer: This is not legal advice."
+"""
+    else:
+        shape = "Keep the same four headings (Summary, Key Clauses / Terms, Risks / Red Flags, Suggested Improvements / Questions to Ask)."
+
+    return f"""
+You are LegalEase, an AI legal information assistant (not a lawyer).
+
+Task: Merge the per-part review findings below into ONE review of the whole document.
+Constraints:
+- Do NOT provide legal advice; provide general informational analysis.
+- Use only the findings given; do NOT invent terms.
+- De-duplicate; when parts conflict, say so and cite the parts/sections.
+- Limit the summary to 5-6 bullets max.
+- Output MUST be Markdown only.
+
+Context:
+Jurisdiction: {jurisdiction}
+Document type hint (may be empty): {doc_type_hint}
+
+{shape}
+
+FINDINGS:
+---
+{findings}
+---
+""".strip()
+
+
+def _review_chunk(chunk: str, idx: int, jurisdiction: str, doc_type_hint: str) -> str:
+    key = llm_cache.cache_key(CHUNK_PROMPT_VERSION, MODEL, TEMPERATURE, jurisdiction, doc_type_hint, str(idx), chunk)
+    prompt = _build_chunk_prompt(chunk, idx, jurisdiction, doc_type_hint)
+    return llm_cache.cached(key, lambda: safe_generate_text(prompt, temperature=TEMPERATURE))
+
+
+def _merged_key(chunks, jurisdiction: str, doc_type_hint: str) -> str:
+    # Same key whether the chunks came from a string or from pages
+    return _key("\n\n".join(chunks), jurisdiction, f"{doc_type_hint}|chunked:{MERGE_PROMPT_VERSION}")
+
+
+def _merge(findings, jurisdiction: str, doc_type_hint: str, max_workers: int) -> str:
+    # Reduce in groups until everything fits into a single merge prompt
+    while True:
+        joined = "\n\n".join(findings)
+        if len(joined) <= MERGE_CHARS or len(findings) == 1:
+            prompt = _build_merge_prompt(joined, jurisdiction, doc_type_hint, final=True)
+            return safe_generate_text(prompt, temperature=TEMPERATURE)
+
+        groups, cur = [], []
+        for f in findings:
+            if cur and sum(len(x) for x in cur) + len(f) > MERGE_CHARS:
+                groups.append(cur)
+                cur = []
+            cur.append(f)
+        groups.append(cur)
+        if len(groups) == len(findings):
+            # Every finding is already MERGE_CHARS on its own; pair them up
+            groups = [findings[i:i + 2] for i in range(0, len(findings), 2)]
+
+        prompts = [
+            _build_merge_prompt("\n\n".join(g), jurisdiction, doc_type_hint, final=False)
+            for g in groups
+        ]
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            findings = list(pool.map(lambda p: safe_generate_text(p, temperature=TEMPERATURE), prompts))
+
+        failed = [i + 1 for i, r in enumerate(findings) if r.startswith("Error:")]
+        if failed:
+            return f"Error: Merge failed for group(s) {', '.join(map(str, failed))}: {findings[failed[0] - 1][6:].strip()}"
+
+
+def review_long_document(text, jurisdiction: str, doc_type_hint: str = "",
+                         max_workers: int = MAX_WORKERS, on_progress=None) -> str:
+    """
+    Map-reduce review for documents too long for one prompt:
+    split into section-aware chunks, review chunks concurrently, then merge
+    the findings into the usual Summary / Key Clauses / Risks sections.
+
+    text may also be an iterable of page texts (e.g. from pdf_utils.iter_pdf_pages);
+    chunks are then reviewed while later pages are still being extracted.
+
+    on_progress(done, total) is called from the calling thread as chunks
+    finish, so it is safe to update Streamlit widgets from it. total is None
+    while chunks are still being produced from pages.
+    """
+    if not has_api_key():
+        return f"Error: {MISSING_KEY_MSG}"
+
+    if isinstance(text, str):
+        text = _clean(text)
+        if not text:
+            return "Error: No document text found."
+
+        chunks = split_into_chunks(text)
+        total = len(chunks)
+        if total == 1:
+            return review_document(text, jurisdiction, doc_type_hint)
+
+        hit = llm_cache.get(_merged_key(chunks, jurisdiction, doc_type_hint))
+        if hit is not None:
+            if on_progress:
+                on_progress(total, total)
+            return hit
+    else:
+        chunks = iter_chunks(text)
+        total = None
+
+    seen, pending, results = [], {}, {}
+
+    def harvest(futures):
+        for fut in futures:
+            results[pending.pop(fut)] = fut.result()
+            if on_progress:
+                on_progress(len(results), total)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        # Submitting while iterating lets page extraction and review overlap.
+        # The first chunk is held back until we know the text needs splitting.
+        for i, c in enumerate(chunks):
+            seen.append(c)
+            if i == 0:
+                continue
+            if i == 1:
+                pending[pool.submit(_review_chunk, seen[0], 1, jurisdiction, doc_type_hint)] = 0
+            pending[pool.submit(_review_chunk, c, i + 1, jurisdiction, doc_type_hint)] = i
+            harvest([f for f in pending if f.done()])
+        if not seen:
+            return "Error: No document text found."
+        if len(seen) == 1:
+            return review_document(seen[0], jurisdiction, doc_type_hint)
+        total = len(seen)
+        harvest(as_completed(list(pending)))
+
+    results = [results[i] for i in range(total)]
+    failed = [i + 1 for i, r in enumerate(results) if r.startswith("Error:")]
+    if failed:
+        return f"Error: Review failed for part(s) {', '.join(map(str, failed))}: {results[failed[0] - 1][6:].strip()}"
+
+    # For pages the document (and so the key) is only known now
+    key = _merged_key(seen, jurisdiction, doc_type_hint)
+    hit = llm_cache.get(key)
+    if hit is not None:
+        return hit
+
+    findings = [f"### Part {i + 1} of {total}\n{r}" for i, r in enumerate(results)]
+    md = _merge(findings, jurisdiction, doc_type_hint, max_workers)
+    if md and not md.startswith("Error:"):
+        llm_cache.put(key, md)
+    return md
@@ -0,0 +1,608 @@
+import streamlit as st
+from common import sidebar, apply_base_style
+from llm_draft import polish_markdown, draft_custom_markdown
+from draft_templates import render_document, TEMPLATES
+from draft_export import export, csv_template, rows_from_csv, bulk_export, FORMATS
+
+apply_base_style()
+
+jurisdiction, ack = sidebar()
+
+st.title("Draft")
+st.caption("Fill in details → generate a draft document (not legal advice).")
+
+if not ack:
+    st.warning("Please acknowledge the disclaimer in the sidebar to use Draft.")
+    st.stop()
+
+
+# DOCX/PDF conversion takes tens of ms; do it once per draft text, not on every rerun
+@st.cache_data(max_entries=16, show_spinner=False)
+def export_draft(md: str, fmt: str) -> bytes:
+    return export(md, fmt)
+
+
+# Pull recommendation from Page 2 if available
+rec_doc = st.session_state.get("draft_doc_type", "")
+src_q = st.session_state.get("draft_source_query", "")
+
+st.markdown(
+    f"<span style='color: rgba(2, 6, 23, 0.65);'>Jurisdiction:</span> "
+    f"<span style='color:#2563eb; font-weight:600;'>{jurisdiction}</span>",
+    unsafe_allow_html=True
+)
+
+if rec_doc:
+    st.write("")
+    st.markdown(
+        f"""
+<div style="background:#ffffff; border:1px solid rgba(2,6,23,0.08); border-radius:16px; padding:14px 16px; box-shadow:0 1px 2px rgba(2,6,23,0.05);">
+  <div style="color: rgba(2,6,23,0.65); font-size:0.9rem;">Recommended from Document Recommendation</div>
+  <div style="color:#2563eb; font-size:1.1rem; font-weight:800; margin-top:2px;">{rec_doc}</div>
+</div>
+        """,
+        unsafe_allow_html=True
+    )
+    if src_q:
+        st.caption(f"Based on: {src_q}")
+
+st.write("")
+
+doc_choices = [
+    "Mutual NDA",
+    "One-way NDA",
+    "Service Agreement / Freelance Contract",
+    "Employment Offer Letter",
+    "Demand / Notice Letter",
+    "Other (custom)",
+]
+
+default_idx = doc_choices.index(rec_doc) if rec_doc in doc_choices else 0
+doc_type = st.selectbox("Select document type to draft", doc_choices, index=default_idx)
+
+st.write("")
+
+draft_md = ""
+
+# ---------------- NDA ----------------
+if doc_type in ["Mutual NDA", "One-way NDA"]:
+    st.subheader("NDA details")
+
+    with st.form("nda_form"):
+        c1, c2 = st.columns(2)
+        with c1:
+            party_a = st.text_input("Party A (Name)")
+        with c2:
+            party_b = st.text_input("Party B (Name)")
+
+        purpose = st.text_input("Purpose of disclosure", value="Evaluate a potential business relationship")
+        term = st.selectbox("Confidentiality term", ["6 months", "1 year", "2 years", "3 years", "5 years"], index=2)
+        governing = st.text_input("Governing law (optional)", placeholder="e.g., India (West Bengal)")
+
+        with st.expander("Optional clauses (customize)"):
+            st.markdown(
+                "<span style='color: rgba(2,6,23,0.65);'>Toggle clauses to include in the draft.</span>",
+                unsafe_allow_html=True,
+            )
+            opt_compelled = st.checkbox("Compelled disclosure clause (court/order disclosure)", value=True)
+            opt_non_solicit = st.checkbox("Non-solicitation (12 months)", value=False)
+            opt_non_compete = st.checkbox("Limited non-compete (⚠ jurisdiction-sensitive)", value=False)
+            opt_no_publicity = st.checkbox("No publicity / no use of name/logo", value=True)
+            opt_no_assignment = st.checkbox("No assignment without consent", value=True)
+
+        submitted = st.form_submit_button("Save details")
+        if submitted:
+            st.session_state["draft_inputs"] = {
+                "doc_type": doc_type,
+                "party_a": party_a,
+                "party_b": party_b,
+                "purpose": purpose,
+                "term": term,
+                "governing": governing,
+                "opt_compelled_disclosure": opt_compelled,
+                "opt_non_solicit": opt_non_solicit,
+                "opt_non_compete": opt_non_compete,
+                "opt_no_publicity": opt_no_publicity,
+                "opt_no_assignment": opt_no_assignment,
+            }
+            st.success("Saved. You can generate the draft below.")
+
+    st.write("")
+
+    if "draft_inputs" in st.session_state and st.session_state["draft_inputs"].get("doc_type") in ["Mutual NDA", "One-way NDA"]:
+        c3, c4 = st.columns([1, 1])
+        with c3:
+            gen = st.button("Generate draft", type="primary")
+        with c4:
+            if st.button("Reset saved details"):
+                st.session_state.pop("draft_inputs", None)
+                st.session_state.pop("draft_preview_md", None)
+                st.rerun()
+
+        if gen:
+            draft_md = render_document(st.session_state["draft_inputs"]["doc_type"], st.session_state["draft_inputs"], jurisdiction)
+            st.session_state["draft_preview_md"] = draft_md
+
+        draft_md = st.session_state.get("draft_preview_md", "")
+
+# -------- Service Agreement / Freelance Contract --------
+elif doc_type == "Service Agreement / Freelance Contract":
+    st.subheader("Service Agreement details")
+
+    with st.form("sa_form"):
+        c1, c2 = st.columns(2)
+        with c1:
+            client = st.text_input("Client (Name)")
+        with c2:
+            contractor = st.text_input("Contractor / Freelancer (Name)")
+
+        services = st.text_area("Services description", placeholder="e.g., Build a Streamlit web app with Gemini integration.", height=90)
+        deliverables = st.text_area("Deliverables", placeholder="e.g., Source code repo, deployment guide, 2 rounds of revisions.", height=90)
+
+        c3, c4 = st.columns(2)
+        with c3:
+            start_date = st.text_input("Start date", placeholder="e.g., March 1, 2026")
+        with c4:
+            end_date = st.text_input("End date / expected completion", placeholder="e.g., April 15, 2026")
+
+        c5, c6, c7 = st.columns(3)
+        with c5:
+            fee_type = st.selectbox("Fee type", ["Fixed", "Hourly", "Milestone"], index=0)
+        with c6:
+            fee_amount = st.text_input("Amount / Rate", placeholder="e.g., ₹50,000 or $40/hour")
+        with c7:
+            payment_terms = st.text_input("Payment terms", value="Net 15 days from invoice date.")
+
+        governing = st.text_input("Governing law (optional)", placeholder="e.g., India (West Bengal)")
+
+        with st.expander("Optional clauses (customize)"):
+            st.markdown(
+                "<span style='color: rgba(2,6,23,0.65);'>Toggle clauses to include in the draft.</span>",
+                unsafe_allow_html=True,
+            )
+            opt_ip = st.selectbox(
+                "IP ownership",
+                ["Client owns deliverables", "Contractor owns; Client gets license", "As specified in Exhibit A"],
+                index=0,
+            )
+            opt_confidentiality = st.checkbox("Include confidentiality clause", value=True)
+            opt_termination = st.checkbox("Include termination for convenience", value=True)
+            notice_days = st.text_input("Termination notice days", value="7")
+            opt_lim_liability = st.checkbox("Include limitation of liability", value=True)
+            liability_cap = st.text_input("Liability cap", value="Fees paid in the last 3 months")
+            opt_sa_non_solicit = st.checkbox("Include non-solicitation (12 months)", value=False)
+
+        submitted = st.form_submit_button("Save details")
+        if submitted:
+            st.session_state["draft_inputs"] = {
+                "doc_type": doc_type,
+                "client": client,
+                "contractor": contractor,
+                "services": services,
+                "deliverables": deliverables,
+                "start_date": start_date,
+                "end_date": end_date,
+                "fee_type": fee_type,
+                "fee_amount": fee_amount,
+                "payment_terms": payment_terms,
+                "governing": governing,
+                "opt_ip": opt_ip,
+                "opt_confidentiality": opt_confidentiality,
+                "opt_termination": opt_termination,
+                "notice_days": notice_days,
+                "opt_lim_liability": opt_lim_liability,
+                "liability_cap": liability_cap,
+                "opt_sa_non_solicit": opt_sa_non_solicit,
+            }
+            st.success("Saved. You can generate the draft below.")
+
+    st.write("")
+
+    if "draft_inputs" in st.session_state and st.session_state["draft_inputs"].get("doc_type") == "Service Agreement / Freelance Contract":
+        c3, c4 = st.columns([1, 1])
+        with c3:
+            gen = st.button("Generate draft", type="primary")
+        with c4:
+            if st.button("Reset saved details"):
+                st.session_state.pop("draft_inputs", None)
+                st.session_state.pop("draft_preview_md", None)
+                st.rerun()
+
+        if gen:
+            draft_md = render_document(st.session_state["draft_inputs"]["doc_type"], st.session_state["draft_inputs"], jurisdiction)
+            st.session_state["draft_preview_md"] = draft_md
+
+        draft_md = st.session_state.get("draft_preview_md", "")
+
+# -------- Employment Offer Letter --------
+elif doc_type == "Employment Offer Letter":
+    st.subheader("Employment Offer Letter details")
+
+    with st.form("ol_form"):
+        c1, c2 = st.columns(2)
+        with c1:
+            company = st.text_input("Company (Name)")
+        with c2:
+            candidate = st.text_input("Candidate (Name)")
+
+        c3, c4 = st.columns(2)
+        with c3:
+            role = st.text_input("Role / Position", value="Software Engineer")
+        with c4:
+            employment_type = st.selectbox("Employment type", ["Full-time", "Part-time", "Contract"], index=0)
+
+        c5, c6 = st.columns(2)
+        with c5:
+            ol_start_date = st.text_input("Start date", placeholder="e.g., March 10, 2026")
+        with c6:
+            location = st.text_input("Work location", placeholder="e.g., Mumbai / Remote / Hybrid")
+
+        manager = st.text_input("Reporting manager", placeholder="e.g., Engineering Manager")
+
+        c7, c8 = st.columns(2)
+        with c7:
+            salary = st.text_input("Salary / Compensation", placeholder="e.g., ₹12 LPA or $120,000/year")
+        with c8:
+            pay_frequency = st.selectbox("Pay frequency", ["monthly", "bi-weekly", "weekly"], index=0)
+
+        bonus = st.text_input("Bonus / Incentives (optional)", value="N/A")
+        benefits = st.text_area("Benefits (optional)", value="Standard company benefits as applicable.", height=70)
+
+        c9, c10 = st.columns(2)
+        with c9:
+            probation = st.text_input("Probation / trial period", value="3 months")
+        with c10:
+            notice = st.text_input("Notice / termination terms", value="as per applicable law / company policy")
+
+        governing = st.text_input("Governing law (optional)", placeholder="e.g., India (Maharashtra)")
+
+        with st.expander("Optional clauses (customize)"):
+            st.markdown(
+                "<span style='color: rgba(2,6,23,0.65);'>Toggle clauses to include in the letter.</span>",
+                unsafe_allow_html=True,
+            )
+            opt_at_will = st.checkbox("At-will employment clause (if applicable)", value=False)
+            opt_bg_check = st.checkbox("Background / verification contingency", value=True)
+            opt_ol_conf = st.checkbox("Confidentiality reference", value=True)
+            opt_ol_ip = st.checkbox("IP ownership reference", value=True)
+            opt_ol_nca = st.checkbox("Restrictive covenants note (jurisdiction-sensitive)", value=False)
+
+        submitted = st.form_submit_button("Save details")
+        if submitted:
+            st.session_state["draft_inputs"] = {
+                "doc_type": doc_type,
+                "company": company,
+                "candidate": candidate,
+                "role": role,
+                "employment_type": employment_type,
+                "ol_start_date": ol_start_date,
+                "location": location,
+                "manager": manager,
+                "salary": salary,
+                "pay_frequency": pay_frequency,
+                "bonus": bonus,
+                "benefits": benefits,
+                "probation": probation,
+                "notice": notice,
+                "governing": governing,
+                "opt_at_will": opt_at_will,
+                "opt_bg_check": opt_bg_check,
+                "opt_ol_conf": opt_ol_conf,
+                "opt_ol_ip": opt_ol_ip,
+                "opt_ol_nca": opt_ol_nca,
+            }
+            st.success("Saved. You can generate the draft below.")
+
+    st.write("")
+
+    if "draft_inputs" in st.session_state and st.session_state["draft_inputs"].get("doc_type") == "Employment Offer Letter":
+        c3, c4 = st.columns([1, 1])
+        with c3:
+            gen = st.button("Generate draft", type="primary")
+        with c4:
+            if st.button("Reset saved details"):
+                st.session_state.pop("draft_inputs", None)
+                st.session_state.pop("draft_preview_md", None)
+                st.rerun()
+
+        if gen:
+            draft_md = render_document(st.session_state["draft_inputs"]["doc_type"], st.session_state["draft_inputs"], jurisdiction)
+            st.session_state["draft_preview_md"] = draft_md
+
+        draft_md = st.session_state.get("draft_preview_md", "")
+
+# -------- Demand / Notice Letter --------
+elif doc_type == "Demand / Notice Letter":
+    st.subheader("Demand / Notice Letter details")
+
+    with st.form("notice_form"):
+        st.markdown("**Sender details**")
+        sender = st.text_input("Sender name")
+        sender_addr = st.text_area("Sender address", height=60)
+        sender_email = st.text_input("Sender email")
+
+        st.write("")
+        st.markdown("**Recipient details**")
+        recipient = st.text_input("Recipient name")
+        recipient_addr = st.text_area("Recipient address", height=60)
+
+        st.write("")
+        subject = st.text_input("Subject", value="Legal Notice / Demand for Resolution")
+
+        tone = st.selectbox("Tone", ["Polite", "Firm", "Aggressive"], index=1)
+
+        relationship = st.text_area(
+            "Relationship / context",
+            placeholder="e.g., I paid an advance for a service on Jan 10. Work was not delivered.",
+            height=80,
+        )
+        issue = st.text_area(
+            "Issue / breach (facts only)",
+            placeholder="e.g., Despite reminders on Feb 1 and Feb 5, service was not delivered and no refund was issued.",
+            height=110,
+        )
+
+        c1, c2 = st.columns(2)
+        with c1:
+            amount = st.text_input("Amount involved (optional)", placeholder="e.g., ₹25,000")
+        with c2:
+            deadline = st.text_input("Deadline (days)", value="7")
+
+        demand = st.text_area(
+            "What do you demand?",
+            placeholder="e.g., Refund the full amount and confirm cancellation in writing.",
+            height=80,
+        )
+
+        evidence = st.text_area(
+            "Supporting documents / evidence list (bullets are fine)",
+            value="- Emails/WhatsApp messages\n- Invoice/receipt\n- Contract/quotation\n- Screenshots",
+            height=90,
+        )
+
+        governing = st.text_input("Governing law (optional)", placeholder="e.g., India (Maharashtra)")
+
+        with st.expander("Optional clauses (customize)"):
+            st.markdown(
+                "<span style='color: rgba(2,6,23,0.65);'>Toggle clauses to include in the letter.</span>",
+                unsafe_allow_html=True,
+            )
+            opt_without_prejudice = st.checkbox("Add 'Without Prejudice' line", value=True)
+            opt_payment_plan = st.checkbox("Offer payment plan option (if money involved)", value=False)
+            opt_preserve_evidence = st.checkbox("Ask recipient to preserve evidence", value=True)
+
+        submitted = st.form_submit_button("Save details")
+        if submitted:
+            st.session_state["draft_inputs"] = {
+                "doc_type": doc_type,
+                "sender": sender,
+                "sender_addr": sender_addr,
+                "sender_email": sender_email,
+                "recipient": recipient,
+                "recipient_addr": recipient_addr,
+                "subject": subject,
+                "tone": tone,
+                "relationship": relationship,
+                "issue": issue,
+                "amount": amount,
+                "deadline": deadline,
+                "demand": demand,
+                "evidence": evidence,
+                "governing": governing,
+                "opt_without_prejudice": opt_without_prejudice,
+                "opt_payment_plan": opt_payment_plan,
+                "opt_preserve_evidence": opt_preserve_evidence,
+            }
+            st.success("Saved. You can generate the draft below.")
+
+    st.write("")
+
+    if "draft_inputs" in st.session_state and st.session_state["draft_inputs"].get("doc_type") == "Demand / Notice Letter":
+        c3, c4 = st.columns([1, 1])
+        with c3:
+            gen = st.button("Generate draft", type="primary")
+        with c4:
+            if st.button("Reset saved details"):
+                st.session_state.pop("draft_inputs", None)
+                st.session_state.pop("draft_preview_md", None)
+                st.rerun()
+
+        if gen:
+            draft_md = render_document(st.session_state["draft_inputs"]["doc_type"], st.session_state["draft_inputs"], jurisdiction)
+            st.session_state["draft_preview_md"] = draft_md
+
+        draft_md = st.session_state.get("draft_preview_md", "")
+
+# -------- Other (custom) --------
+elif doc_type == "Other (custom)":
+    st.subheader("Custom document (AI-assisted)")
+
+    st.markdown(
+        "<span style='color: rgba(2,6,23,0.65);'>"
+        "Provide structured details. LegalEase will generate a conservative draft with placeholders for missing info."
+        "</span>",
+        unsafe_allow_html=True
+    )
+
+    with st.form("custom_form"):
+        title = st.text_input("Document title", placeholder="e.g., Partnership Agreement / MoU / Settlement Agreement")
+        doc_kind = st.text_input("Document category/type", placeholder="e.g., MoU, Agreement, Notice, Policy")
+
+        parties = st.text_area(
+            "Parties (who is involved?)",
+            placeholder="e.g., Party A: ABC Pvt Ltd (Client)\nParty B: John Doe (Consultant)",
+            height=90,
+        )
+
+        goal = st.text_area(
+            "Goal (what should this document achieve?)",
+            placeholder="e.g., Define responsibilities, payment terms, IP ownership, and termination.",
+            height=80,
+        )
+
+        facts = st.text_area(
+            "Key facts / situation (facts only)",
+            placeholder="e.g., Contractor will build an app in 6 weeks; client provides content; milestone reviews weekly.",
+            height=110,
+        )
+
+        terms = st.text_area(
+            "Key terms (money/timeline/constraints)",
+            placeholder="e.g., ₹50,000 total; 50% upfront; deliver by April 15; two revisions included.",
+            height=90,
+        )
+
+        tone = st.selectbox("Tone", ["Neutral", "Friendly", "Firm"], index=0)
+
+        clauses = st.multiselect(
+            "Clauses to include (select as needed)",
+            [
+                "Confidentiality",
+                "IP ownership",
+                "Payment terms",
+                "Milestones & acceptance",
+                "Termination",
+                "Limitation of liability",
+                "Indemnity",
+                "Non-solicitation",
+                "Non-compete (jurisdiction-sensitive)",
+                "Dispute resolution",
+                "Governing law",
+            ],
+            default=["Payment terms", "Termination", "Dispute resolution", "Governing law"],
+        )
+
+        signatures = st.checkbox("Include signature blocks", value=True)
+
+        extra = st.text_area(
+            "Extra instructions (optional)",
+            placeholder="e.g., Keep it 1–2 pages. Add an Exhibit A for deliverables.",
+            height=80,
+        )
+
+        st.write("")
+        safety_ack = st.checkbox("I understand this is informational drafting help, not legal advice.", value=False)
+
+        submitted = st.form_submit_button("Save details")
+        if submitted:
+            if not safety_ack:
+                st.warning("Please acknowledge the informational-only disclaimer to proceed.")
+            else:
+                st.session_state["draft_inputs"] = {
+                    "doc_type": doc_type,
+                    "title": title,
+                    "doc_kind": doc_kind,
+                    "parties": parties,
+                    "goal": goal,
+                    "facts": facts,
+                    "terms": terms,
+                    "tone": tone,
+                    "clauses": clauses,
+                    "signatures": "Yes" if signatures else "No",
+                    "extra": extra,
+                }
+                st.success("Saved. You can generate the draft below.")
+
+    st.write("")
+
+    if "draft_inputs" in st.session_state and st.session_state["draft_inputs"].get("doc_type") == "Other (custom)":
+        c3, c4 = st.columns([1, 1])
+        with c3:
+            gen = st.button("Generate draft", type="primary")
+        with c4:
+            if st.button("Reset saved details"):
+                st.session_state.pop("draft_inputs", None)
+                st.session_state.pop("draft_preview_md", None)
+                st.rerun()
+
+        if gen:
+            with st.spinner("Generating…"):
+                draft_md = draft_custom_markdown(st.session_state["draft_inputs"], jurisdiction)
+            st.session_state["draft_preview_md"] = draft_md
+
+        draft_md = st.session_state.get("draft_preview_md", "")
+
+
+
+# ---------------- Preview + AI Polish ----------------
+if draft_md:
+    st.subheader("Draft preview")
+
+    c5, c6 = st.columns([1, 1])
+    with c5:
+        ai_polish = st.button("AI Polish (improve wording)")
+    with c6:
+        st.caption("Keeps facts same; improves clarity.")
+
+    if ai_polish:
+        with st.spinner("Polishing…"):
+            polished = polish_markdown(draft_md, jurisdiction)
+        st.session_state["draft_preview_md"] = polished
+        draft_md = polished
+        st.success("Polished draft ready.")
+
+    st.text_area("Generated draft (Markdown)", value=draft_md, height=520)
+
+    d1, d2, d3 = st.columns(3)
+    with d1:
+        st.download_button(
+            "Download as .md",
+            data=draft_md.encode("utf-8"),
+            file_name="LegalEase_Draft.md",
+            mime="text/markdown",
+        )
+    with d2:
+        st.download_button(
+            "Download as .docx",
+            data=export_draft(draft_md, "docx"),
+            file_name="LegalEase_Draft.docx",
+            mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        )
+    with d3:
+        st.download_button(
+            "Download as .pdf",
+            data=export_draft(draft_md, "pdf"),
+            file_name="LegalEase_Draft.pdf",
+            mime="application/pdf",
+        )
+
+# ---------------- Bulk export ----------------
+if doc_type in TEMPLATES:
+    st.write("")
+    with st.expander(f"Bulk export from CSV ({doc_type})"):
+        st.caption("One row per document. Columns starting with opt_ accept yes/no.")
+        st.download_button(
+            "Download CSV template",
+            data=csv_template(doc_type),
+            file_name="LegalEase_bulk_template.csv",
+            mime="text/csv",
+        )
+        uploaded_csv = st.file_uploader("Upload filled CSV", type=["csv"], key="bulk_csv")
+        formats = st.multiselect("Formats", list(FORMATS), default=["docx", "pdf"])
+
+        if uploaded_csv and formats and st.button("Build ZIP"):
+            try:
+                rows = rows_from_csv(uploaded_csv.getvalue(), doc_type)
+            except (UnicodeDecodeError, ValueError) as e:
+                rows = None
+                st.error(f"Could not read CSV: {e}")
+
+            if rows:
+                bar = st.progress(0.0)
+                zip_bytes = bulk_export(
+                    doc_type, rows, jurisdiction, formats,
+                    on_progress=lambda done, total: bar.progress(done / total, text=f"{done}/{total} documents"),
+                )
+                st.session_state["bulk_zip"] = zip_bytes
+                st.success(f"Rendered {len(rows)} documents.")
+            elif rows is not None:
+                st.warning("The CSV has no data rows.")
+
+        if st.session_state.get("bulk_zip"):
+            st.download_button(
+                "Download ZIP",
+                data=st.session_state["bulk_zip"],
+                file_name="LegalEase_Drafts.zip",
+                mime="application/zip",
+            )
+
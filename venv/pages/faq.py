@@ -0,0 +1,119 @@
+import streamlit as st
+from common import sidebar, apply_base_style
+from llm_faq import answer_faq_stream, lookup_answer, search_faq, FAQ_BANK
+
+apply_base_style()
+
+jurisdiction, ack = sidebar()
+
+st.title("FAQ & Knowledge Base")
+st.caption("Common legal questions explained simply (informational only).")
+
+if not ack:
+    st.warning("Please acknowledge the disclaimer in the sidebar to use this feature.")
+    st.stop()
+
+st.markdown(
+    f"<span style='color: rgba(2, 6, 23, 0.65);'>Jurisdiction:</span> "
+    f"<span style='color:#2563eb; font-weight:600;'>{jurisdiction}</span>",
+    unsafe_allow_html=True
+)
+
+st.write("")
+query = st.text_input("Search questions", placeholder="Type keywords like 'NDA', 'invoice', 'probation'...")
+
+picked = None
+if query.strip():
+    # Ranked fuzzy matches over the FAQ bank and questions answered before
+    results = search_faq(query, jurisdiction, limit=8)
+    if results:
+        with st.expander("Best matches", expanded=True):
+            for i, r in enumerate(results):
+                tip = "Answered before; shown instantly." if r["answered"] else r["section"]
+                if st.button(r["question"], key=f"faq_hit_{i}", help=tip, use_container_width=True):
+                    picked = r["question"]
+                    st.session_state["faq_q"] = picked
+    else:
+        st.caption("No matching questions. Ask your own below.")
+else:
+    for section, qs in FAQ_BANK.items():
+        with st.expander(section, expanded=False):
+            for q in qs:
+                if st.button(q, use_container_width=True):
+                    picked = q
+                    st.session_state["faq_q"] = q
+
+st.write("")
+st.markdown("---")
+st.subheader("Ask your own question")
+
+custom_q = st.text_area("Question", height=90, placeholder="Type your legal question here (general info only).")
+c1, c2 = st.columns([1, 1])
+with c1:
+    ask_btn = st.button("Get answer", type="primary")
+with c2:
+    clear_btn = st.button("Clear")
+
+if clear_btn:
+    st.session_state.pop("faq_answer_md", None)
+    st.session_state.pop("faq_q", None)
+    st.session_state.pop("faq_answered_for", None)
+    st.session_state.pop("faq_similar_to", None)
+    st.rerun()
+
+final_q = ""
+if ask_btn:
+    final_q = custom_q.strip()
+elif "faq_q" in st.session_state:
+    final_q = st.session_state["faq_q"]
+
+# Only call the model when the question (or jurisdiction) actually changed,
+# not on every rerun while faq_q is still in session state
+streamed = False
+if final_q and st.session_state.get("faq_answered_for") != (final_q, jurisdiction):
+    st.write("")
+    st.markdown("### Answer")
+    # Same or near-duplicate question answered before: no model call
+    found = lookup_answer(final_q, jurisdiction)
+    if found:
+        similar_to, md = found
+        st.markdown(md)
+    else:
+        similar_to = final_q
+        md = st.write_stream(answer_faq_stream(final_q, jurisdiction))
+    st.session_state["faq_answer_md"] = md
+    st.session_state["faq_similar_to"] = similar_to
+    st.session_state["faq_q"] = final_q
+    st.session_state["faq_answered_for"] = (final_q, jurisdiction)
+    streamed = True
+
+md = st.session_state.get("faq_answer_md", "")
+if md:
+    if not streamed:
+        st.write("")
+        st.markdown("### Answer")
+        st.markdown(md)
+
+    similar_to = st.session_state.get("faq_similar_to", "")
+    asked = st.session_state.get("faq_q", "")
+    if similar_to and similar_to.strip().lower() != asked.strip().lower():
+        st.caption(f"Answered instantly from a similar question: “{similar_to}”")
+
+    st.download_button(
+        "Download answer as .md",
+        data=md.encode("utf-8"),
+        file_name="LegalEase_FAQ_Answer.md",
+        mime="text/markdown",
+    )
+
+    related = [
+        r for r in search_faq(asked, jurisdiction, limit=5)
+        if r["question"].strip().lower() not in {asked.strip().lower(), similar_to.strip().lower()}
+    ][:3]
+    if related:
+        st.write("")
+        st.markdown("**Related questions**")
+        for i, r in enumerate(related):
+            if st.button(r["question"], key=f"faq_related_{i}", use_container_width=True):
+                st.session_state["faq_q"] = r["question"]
+                st.rerun()
@@ -0,0 +1,185 @@
+import streamlit as st
+from common import sidebar, apply_base_style
+from llm_review import review_document_stream, review_long_document, LONG_DOC_CHARS
+from pdf_utils import iter_pdf_pages, pdf_page_count, join_pages, CHARS_PER_PAGE
+from risk_scan import scan as risk_scan, highlight_snippets
+
+apply_base_style()
+
+jurisdiction, ack = sidebar()
+
+st.title("Review & Summarize")
+st.caption("Paste or upload a document to get a structured review (informational only).")
+
+if not ack:
+    st.warning("Please acknowledge the disclaimer in the sidebar to use this feature.")
+    st.stop()
+
+st.markdown(
+    f"<span style='color: rgba(2, 6, 23, 0.65);'>Jurisdiction:</span> "
+    f"<span style='color:#2563eb; font-weight:600;'>{jurisdiction}</span>",
+    unsafe_allow_html=True
+)
+
+st.write("")
+
+doc_type_hint = st.selectbox(
+    "Document type (optional)",
+    ["", "NDA", "Service Agreement", "Employment Offer Letter", "Lease", "Terms of Service", "Other"],
+    index=0
+)
+
+tab1, tab2 = st.tabs(["Paste text", "Upload file"])
+
+text = ""
+pdf_bytes = None
+# Pages shown in the preview; the full PDF is extracted when the review runs,
+# so long documents are chunked and reviewed while later pages are extracted
+PREVIEW_PAGES = 5
+
+with tab1:
+    text = st.text_area(
+        "Paste document text",
+        placeholder="Paste the contract/agreement text here…",
+        height=260
+    )
+
+with tab2:
+    f = st.file_uploader("Upload a .txt or .pdf file", type=["txt", "pdf"])
+    if f is not None:
+        try:
+            raw = f.read()
+
+            if f.name.lower().endswith(".txt"):
+                text = raw.decode("utf-8", errors="ignore")
+                preview = text
+                st.success("Text file loaded.")
+            else:
+                pdf_bytes = raw
+                n_pages = pdf_page_count(raw)
+                preview = join_pages(t for _, t in iter_pdf_pages(raw, max_pages=PREVIEW_PAGES))
+                text = ""
+                if preview:
+                    st.success(f"PDF loaded ({n_pages} pages).")
+                else:
+                    st.warning(
+                        "PDF loaded, but no extractable text was found on the first pages (may be scanned). "
+                        "Try copy-pasting text instead."
+                    )
+
+            if preview.strip():
+                with st.expander("Preview extracted text"):
+                    st.text_area("Extracted text", value=preview[:12000], height=260)
+
+        except Exception as e:
+            pdf_bytes = None
+            st.error(f"Could not read file: {e}")
+
+est_chars = n_pages * CHARS_PER_PAGE if pdf_bytes is not None else len(text)
+long_mode = st.checkbox(
+    "Long document mode (review in parallel chunks, then merge)",
+    value=est_chars > LONG_DOC_CHARS,
+    help="Used automatically for long contracts so every page is covered.",
+)
+
+c1, c2 = st.columns([1, 1])
+with c1:
+    run_btn = st.button("Review document", type="primary")
+with c2:
+    clear_btn = st.button("Clear")
+
+if clear_btn:
+    st.session_state.pop("review_md", None)
+    st.session_state.pop("review_src", None)
+    st.rerun()
+
+if run_btn:
+    if not text.strip() and pdf_bytes is None:
+        st.warning("Paste text or upload a .txt file first.")
+        st.stop()
+
+    st.write("")
+    st.subheader("Review result")
+    if long_mode:
+        bar = st.progress(0.0, text="Extracting and splitting document…")
+
+        def _progress(done, total):
+            if total is None:
+                bar.progress(0.0, text=f"Extracting and splitting document… ({done} part(s) reviewed)")
+            else:
+                bar.progress(done / total, text=f"Reviewed part {done} of {total}")
+
+        if pdf_bytes is not None:
+            # Pages feed the chunker as they are extracted; keep them for the risk meter
+            pages = []
+
+            def _pages():
+                for _, t in iter_pdf_pages(pdf_bytes, max_pages=None):
+                    pages.append(t)
+                    yield t
+
+            source = _pages()
+        else:
+            source = text.strip()
+
+        with st.spinner("Reviewing parts and merging findings…"):
+            md = review_long_document(source, jurisdiction, doc_type_hint, on_progress=_progress)
+        bar.empty()
+        if pdf_bytes is not None:
+            text = join_pages(pages)
+        st.markdown(md)
+    else:
+        if pdf_bytes is not None:
+            with st.spinner("Extracting PDF text…"):
+                text = join_pages(t for _, t in iter_pdf_pages(pdf_bytes, max_pages=None))
+            if not text:
+                st.warning("No extractable text was found in the PDF (may be scanned).")
+                st.stop()
+        md = st.write_stream(review_document_stream(text.strip(), jurisdiction, doc_type_hint))
+
+    st.session_state["review_md"] = md
+    st.session_state["review_src"] = text.strip()
+
+md = st.session_state.get("review_md", "")
+if md:
+    if not run_btn:
+        st.write("")
+        st.subheader("Review result")
+        st.markdown(md)
+    
+    # Score the contract itself (not the model's wording of it)
+    src = st.session_state.get("review_src", "")
+    risk = risk_scan(src or md)
+    lvl, score, hits = risk["level"], risk["score"], risk["terms"][:10]
+    
+    color = {"Low": "#16a34a", "Medium": "#f59e0b", "High": "#ef4444"}[lvl]
+    
+    st.markdown(
+        f"""
+    <div style="background:#ffffff; border:1px solid rgba(2,6,23,0.08); border-radius:16px; padding:14px 16px;
+                box-shadow:0 1px 2px rgba(2,6,23,0.05); margin-top:12px;">
+        <div style="color: rgba(2,6,23,0.65); font-size:0.95rem;">Risk Meter (heuristic)</div>
+        <div style="color:{color}; font-size:1.25rem; font-weight:900; margin-top:2px;">{lvl} risk</div>
+        <div style="color: rgba(2,6,23,0.72); margin-top:6px;">Score: <b>{score}</b> (based on detected red-flag terms in the document)</div>
+    </div>
+    """,
+        unsafe_allow_html=True
+    )
+
+    if hits:
+        st.caption("Detected terms: " + ", ".join(hits))
+
+    if src and risk["hits"]:
+        with st.expander(f"Highlighted clauses ({len(risk['hits'])} matches)"):
+            for snippet in highlight_snippets(src, risk["hits"]):
+                st.markdown(
+                    f"<div style='font-size:0.92rem; line-height:1.45; margin-bottom:10px;'>{snippet}</div>",
+                    unsafe_allow_html=True,
+                )
+
+    st.download_button(
+        "Download review as .md",
+        data=md.encode("utf-8"),
+        file_name="LegalEase_Review.md",
+        mime="text/markdown",
+    )
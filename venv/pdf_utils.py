@@ -0,0 +1,165 @@
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+import fitz  # PyMuPDF
+from proc_pool import MAX_WORKERS, process_pool, iter_with_fallback
+
+# Files with at least this many pages are extracted on a process pool
+PARALLEL_MIN_PAGES = int(os.getenv("LEGALEASE_PDF_PARALLEL_MIN_PAGES", "40"))
+BATCH_PAGES = 16
+# Rough characters per page of a typed contract; used to pick a review mode
+# before the pages have been extracted
+CHARS_PER_PAGE = 3000
+
+# Extracted pages per file content hash, so Streamlit reruns are free
+CACHE_MAX_FILES = 16
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+_ocr_hook = None
+
+
+def set_ocr_hook(fn):
+    """
+    Route pages with no text layer (e.g. scanned pages) to fn(page) -> str.
+    fn must be a module-level function so it can be sent to worker processes.
+    Pass None to disable.
+    """
+    global _ocr_hook
+    _ocr_hook = fn
+
+
+def pymupdf_ocr(page) -> str:
+    """OCR hook using PyMuPDF's built-in Tesseract bridge (needs Tesseract installed)."""
+    tp = page.get_textpage_ocr(full=True, dpi=200)
+    return page.get_text("text", textpage=tp) or ""
+
+
+if os.getenv("LEGALEASE_OCR") == "1":
+    set_ocr_hook(pymupdf_ocr)
+
+
+def _page_text(page, ocr) -> str:
+    t = (page.get_text("text") or "").strip()
+    if not t and ocr is not None:
+        try:
+            t = (ocr(page) or "").strip()
+        except Exception:
+            # OCR is best-effort; an OCR failure should not fail the whole file
+            t = ""
+    return t
+
+
+def _extract_range(doc, start: int, stop: int, ocr):
+    return [(i + 1, _page_text(doc.load_page(i), ocr)) for i in range(start, stop)]
+
+
+# ---------------- Process pool workers ----------------
+
+_worker_doc = None
+
+
+def _init_worker(file_bytes: bytes):
+    # Each worker opens the PDF once instead of receiving the bytes per batch
+    global _worker_doc
+    _worker_doc = fitz.open(stream=file_bytes, filetype="pdf")
+
+
+def _worker_extract(start: int, stop: int, ocr):
+    return _extract_range(_worker_doc, start, stop, ocr)
+
+
+# ---------------- Public API ----------------
+
+def file_hash(file_bytes: bytes) -> str:
+    return hashlib.sha256(file_bytes).hexdigest()
+
+
+def _cache_get(key):
+    with _cache_lock:
+        pages = _cache.get(key)
+        if pages is not None:
+            _cache.move_to_end(key)
+        return pages
+
+
+def _cache_put(key, pages):
+    with _cache_lock:
+        _cache[key] = pages
+        _cache.move_to_end(key)
+        while len(_cache) > CACHE_MAX_FILES:
+            _cache.popitem(last=False)
+
+
+def _iter_sequential(file_bytes: bytes, n: int, ocr, start: int = 0):
+    doc = fitz.open(stream=file_bytes, filetype="pdf")
+    try:
+        for i in range(start, n):
+            yield i + 1, _page_text(doc.load_page(i), ocr)
+    finally:
+        doc.close()
+
+
+def _iter_parallel(file_bytes: bytes, n: int, ocr, workers: int):
+    with process_pool(workers, initializer=_init_worker, initargs=(file_bytes,)) as pool:
+        futures = [
+            pool.submit(_worker_extract, start, min(start + BATCH_PAGES, n), ocr)
+            for start in range(0, n, BATCH_PAGES)
+        ]
+        try:
+            # Batches are consumed in order, so early pages flow out first
+            for fut in futures:
+                yield from fut.result()
+        finally:
+            for fut in futures:
+                fut.cancel()
+
+
+def pdf_page_count(file_bytes: bytes) -> int:
+    with fitz.open(stream=file_bytes, filetype="pdf") as doc:
+        return doc.page_count
+
+
+def iter_pdf_pages(file_bytes: bytes, max_pages: int = None, ocr="default", workers: int = None):
+    """
+    Yields (page_number, text) for each page, in order, as soon as it is ready.
+    Pages without extractable text are sent to the OCR hook (if any), otherwise
+    they come back as "". Results are cached by file content hash.
+    """
+    if ocr == "default":
+        ocr = _ocr_hook
+
+    key = (file_hash(file_bytes), max_pages, getattr(ocr, "__qualname__", None))
+    pages = _cache_get(key)
+    if pages is not None:
+        yield from pages
+        return
+
+    n = pdf_page_count(file_bytes)
+    if max_pages is not None:
+        n = min(n, max_pages)
+
+    workers = MAX_WORKERS if workers is None else workers
+    if workers > 1 and n >= PARALLEL_MIN_PAGES:
+        source = iter_with_fallback(
+            _iter_parallel(file_bytes, n, ocr, workers),
+            lambda done: _iter_sequential(file_bytes, n, ocr, start=done),
+        )
+    else:
+        source = _iter_sequential(file_bytes, n, ocr)
+
+    pages = []
+    for page in source:
+        pages.append(page)
+        yield page
+    _cache_put(key, pages)
+
+
+def join_pages(pages) -> str:
+    return "\n\n".join(t for t in pages if t).strip()
+
+
+def extract_pdf_text(file_bytes: bytes, max_pages: int = 30) -> str:
+    """max_pages=None extracts every page."""
+    return join_pages(t for _, t in iter_pdf_pages(file_bytes, max_pages=max_pages))
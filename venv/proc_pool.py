@@ -0,0 +1,36 @@
+"""
+Process pools for CPU-bound work (PDF text extraction, DOCX/PDF export),
+set up the same way everywhere.
+"""
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+MAX_WORKERS = max(1, min(4, (os.cpu_count() or 1)))
+
+# Never fork: callers (Streamlit, batch_review) are multi-threaded, and a
+# forked child can inherit a MuPDF or SQLite lock held by another thread
+START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+
+def process_pool(workers: int, **kwargs) -> ProcessPoolExecutor:
+    """ProcessPoolExecutor using START_METHOD; kwargs go to the executor."""
+    return ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context(START_METHOD), **kwargs
+    )
+
+
+def iter_with_fallback(parallel, serial):
+    """
+    Yields from the parallel iterable. If the worker processes cannot run here
+    (BrokenProcessPool), yields the rest from serial(done) in-process, where
+    done is the number of items already yielded.
+    """
+    done = 0
+    try:
+        for item in parallel:
+            yield item
+            done += 1
+    except BrokenProcessPool:
+        yield from serial(done)
@@ -0,0 +1,198 @@
+import os
+import re
+import json
+import html
+
+# term -> weight. High-risk terms weigh 3, medium-risk terms 1.
+DEFAULT_LEXICON = {
+    "unilateral": 3,
+    "sole discretion": 3,
+    "perpetual": 3,
+    "irrevocable": 3,
+    "indemnify": 3,
+    "liquidated damages": 3,
+    "no refund": 3,
+    "non-refundable": 3,
+    "automatic renewal": 3,
+    "waive": 3,
+    "waiver": 3,
+    "penalty": 3,
+    "injunctive": 3,
+    "consequential damages excluded": 3,
+    "arbitration": 1,
+    "governing law": 1,
+    "termination for convenience": 1,
+    "assignment": 1,
+    "confidentiality": 1,
+    "ip ownership": 1,
+    "limitation of liability": 1,
+    "late fee": 1,
+}
+
+# term -> other surface forms counted as that term ("indemnifies" -> "indemnify").
+# Listed per term: suffix rules would also invent forms like "governing lawed".
+DEFAULT_FORMS = {
+    "indemnify": ("indemnifies", "indemnified", "indemnifying", "indemnification"),
+    "automatic renewal": ("automatic renewals",),
+    "waive": ("waives", "waived", "waiving"),
+    "waiver": ("waivers",),
+    "penalty": ("penalties",),
+    "assignment": ("assignments",),
+    "late fee": ("late fees",),
+}
+
+# score >= HIGH -> High, score >= MEDIUM -> Medium, else Low
+THRESHOLDS = {"High": 10, "Medium": 5}
+
+
+def load_lexicon(path: str) -> dict:
+    """Load a {"term": weight, ...} JSON file."""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return {str(k).lower(): int(v) for k, v in data.items()}
+
+
+def _norm_term(s: str) -> str:
+    return re.sub(r"\s+", " ", s.strip().lower())
+
+
+def _trie_regex(terms) -> str:
+    """
+    Build one regex from a trie of the terms, so each position in the text is
+    tested against shared prefixes once instead of once per term.
+    """
+    trie = {}
+    for t in terms:
+        node = trie
+        for ch in t:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node) -> str:
+        end = "" in node
+        branches = []
+        for ch in sorted(k for k in node if k):
+            atom = r"\s+" if ch == " " else re.escape(ch)
+            branches.append(atom + build(node[ch]))
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # A term may also stop here; the longer continuation is tried first
+        return f"(?:{body})?" if end else body
+
+    return build(trie)
+
+
+class RiskScanner:
+    """
+    Single-pass, word-boundary-aware matcher over a weighted lexicon.
+    Compile once, reuse for every document.
+    """
+
+    def __init__(self, lexicon: dict = None, thresholds: dict = None, forms: dict = None):
+        lexicon = lexicon or DEFAULT_LEXICON
+        self.lexicon = {_norm_term(k): int(v) for k, v in lexicon.items()}
+        if not self.lexicon:
+            raise ValueError("Risk lexicon is empty.")
+        self.thresholds = thresholds or THRESHOLDS
+
+        # surface form -> lexicon term. Lexicon terms win over another term's
+        # form (e.g. "waiver" stays its own term).
+        self._forms = {}
+        for term, extra in (DEFAULT_FORMS if forms is None else forms).items():
+            term = _norm_term(term)
+            if term in self.lexicon:
+                for form in extra:
+                    self._forms.setdefault(_norm_term(form), term)
+        self._forms.update({t: t for t in self.lexicon})
+
+        # The trie tries longer continuations first, so "waivers" is one hit
+        # for "waiver", not also one for "waive".
+        body = _trie_regex(self._forms)
+        # Cheap first-character check lets the engine skip most positions
+        first = "".join(sorted({re.escape(t[0]) for t in self._forms}))
+        self.pattern = re.compile(rf"\b(?=[{first}]){body}\b")
+        self._pattern_ci = re.compile(rf"\b{body}\b", re.IGNORECASE)
+
+    def find(self, text: str):
+        """Yields (start, end, term) for every lexicon hit, left to right."""
+        text = text or ""
+        lowered = text.lower()
+        # Lowercasing once is much faster than a case-insensitive regex, but a few
+        # Unicode characters change length when lowercased; offsets must stay valid.
+        if len(lowered) == len(text):
+            matches = self.pattern.finditer(lowered)
+        else:
+            matches = self._pattern_ci.finditer(text)
+        for m in matches:
+            yield m.start(), m.end(), self._forms[_norm_term(m.group(0))]
+
+    def scan(self, text: str) -> dict:
+        hits = list(self.find(text))
+        counts = {}
+        for _, _, term in hits:
+            counts[term] = counts.get(term, 0) + 1
+
+        # Each distinct term counts once, so long documents are not penalised
+        # simply for repeating a term.
+        score = sum(self.lexicon[t] for t in counts)
+        if score >= self.thresholds["High"]:
+            level = "High"
+        elif score >= self.thresholds["Medium"]:
+            level = "Medium"
+        else:
+            level = "Low"
+
+        return {
+            "level": level,
+            "score": score,
+            "terms": sorted(counts, key=lambda t: (-self.lexicon[t], t)),
+            "counts": counts,
+            "hits": hits,
+        }
+
+
+_default = None
+
+
+def default_scanner() -> RiskScanner:
+    """Shared scanner; LEGALEASE_RISK_LEXICON can point at a custom JSON lexicon."""
+    global _default
+    if _default is None:
+        path = os.getenv("LEGALEASE_RISK_LEXICON", "").strip()
+        _default = RiskScanner(load_lexicon(path) if path else None)
+    return _default
+
+
+def scan(text: str) -> dict:
+    return default_scanner().scan(text)
+
+
+def highlight_snippets(text: str, hits, context: int = 120, limit: int = 20):
+    """
+    HTML snippets around the first `limit` hits, with matched terms in <mark>.
+    Overlapping windows are merged.
+    """
+    windows = []
+    for start, end, _ in hits:
+        a, b = max(0, start - context), min(len(text), end + context)
+        if windows and a <= windows[-1][1]:
+            windows[-1][1] = max(windows[-1][1], b)
+            windows[-1][2].append((start, end))
+        else:
+            if len(windows) >= limit:
+                break
+            windows.append([a, b, [(start, end)]])
+
+    out = []
+    for a, b, spans in windows:
+        parts, pos = [], a
+        for start, end in spans:
+            parts.append(html.escape(text[pos:start]))
+            parts.append(f"<mark>{html.escape(text[start:end])}</mark>")
+            pos = end
+        parts.append(html.escape(text[pos:b]))
+        prefix = "…" if a > 0 else ""
+        suffix = "…" if b < len(text) else ""
+        out.append(prefix + "".join(parts).replace("\n", " ") + suffix)
+    return out